@@ -0,0 +1,57 @@
+"""Compare memory used by dict-backed and slotted data objects.
+
+Run from the project root with ``python -m benchmarks.memory_comparison [count]``.
+"""
+import sys
+import tracemalloc
+
+from data_object import DataObject, ImmutableDataObject, SlottedDataObject, ImmutableSlottedDataObject
+
+
+class Plain(DataObject):
+    def __init__(self, foo, bar, baz):
+        self.foo = foo
+        self.bar = bar
+        self.baz = baz
+
+
+class Immutable(ImmutableDataObject):
+    def __init__(self, foo, bar, baz):
+        self.foo = foo
+        self.bar = bar
+        self.baz = baz
+
+
+class Slotted(SlottedDataObject):
+    def __init__(self, foo, bar, baz):
+        self.foo = foo
+        self.bar = bar
+        self.baz = baz
+
+
+class ImmutableSlotted(ImmutableSlottedDataObject):
+    def __init__(self, foo, bar, baz):
+        self.foo = foo
+        self.bar = bar
+        self.baz = baz
+
+
+def measure(cls, count):
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    instances = [cls(i, None, True) for i in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return (current - start) / count
+
+
+def main(count=100000):
+    results = [(cls.__name__, measure(cls, count)) for cls in (Plain, Immutable, Slotted, ImmutableSlotted)]
+    baseline = results[0][1]
+    for name, per_instance in results:
+        print('{0:<20} {1:>8.1f} B/instance {2:>6.1%}'.format(name, per_instance, per_instance / baseline))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
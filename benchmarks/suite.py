@@ -0,0 +1,266 @@
+"""Time DataObject operations against plain class, dataclass and namedtuple baselines.
+
+Run from the project root with ``python -m benchmarks.suite [--output FILE] [--compare FILE]``.
+Every sweep starts from the base scenario and changes one dimension (field count, nesting depth or
+property count). Results are seconds per operation; ``--compare`` flags DataObject operations
+slower than in the previous run by more than ``--threshold`` and exits with status 1 when any is found.
+Baselines are only reported, they show how noisy the machine is.
+"""
+import argparse
+import copy
+import dataclasses
+import json
+import platform
+import sys
+import time
+import timeit
+from abc import ABC, abstractmethod
+from collections import namedtuple
+
+from data_object import DataObject, ImmutableDataObject
+
+BASE = {'fields': 5, 'depth': 0, 'properties': 0}
+SWEEPS = {'fields': (1, 5, 20), 'depth': (0, 1, 3), 'properties': (0, 2, 8)}
+QUICK_SWEEPS = {'fields': (1, 5), 'depth': (0, 1), 'properties': (0, 2)}
+DEFAULT_THRESHOLD = 0.25
+OPERATIONS = ('from_dict', 'as_json', 'eq', 'hash', 'str', 'copy')
+
+
+def _source(header, name, fields, child, properties, body=None):
+    lines = [header.format(name=name)]
+    arguments = fields + (('child',) if child else ())
+    if body is None:
+        lines.append('    def __init__(self, {0}):'.format(', '.join(arguments)))
+        lines.extend('        self.{0} = {0}'.format(field) for field in arguments)
+    else:
+        lines.extend(body(arguments, child))
+    for index in range(properties):
+        lines.append('    @property')
+        lines.append('    def prop{0}(self):'.format(index))
+        lines.append('        return self.{0}'.format(fields[index % len(fields)]))
+    return '\n'.join(lines)
+
+
+def _annotated(arguments, child):
+    return ['    {0}: {1}'.format(field, child if field == 'child' else 'int') for field in arguments]
+
+
+def _define(header, name, fields, child, properties, body=None, namespace=None):
+    scope = {'dataclass': dataclasses.dataclass, **(namespace or {})}
+    if child is not None:
+        scope[child.__name__] = child
+    exec(_source(header, name, fields, child and child.__name__, properties, body), scope)
+    return scope[name]
+
+
+def _nested_loader(cls, child_loader):
+    if child_loader is None:
+        return lambda data: cls(**data)
+    return lambda data: cls(**{**data, 'child': child_loader(data['child'])})
+
+
+class Variant(ABC):
+    baseline = True
+
+    def __init__(self, fields, depth, properties) -> None:
+        names = tuple('f{0}'.format(index) for index in range(fields))
+        self.cls = None
+        self.load = None
+        for level in range(depth + 1):
+            self.cls = self.define('Level{0}'.format(level), names, self.cls, properties)
+            self.load = _nested_loader(self.cls, self.load)
+
+    @abstractmethod
+    def define(self, name, fields, child, properties):
+        pass
+
+    def from_dict(self, data):
+        return self.load(data)
+
+    @abstractmethod
+    def as_json(self, obj):
+        pass
+
+    def copy(self, obj):
+        return copy.copy(obj)
+
+
+class DataObjectVariant(Variant):
+    base = DataObject
+    baseline = False
+
+    def define(self, name, fields, child, properties):
+        body = None
+        if child is not None:
+            def body(arguments, child_name):
+                return ['    def __init__(self, {0}, child: {1}):'.format(', '.join(arguments[:-1]), child_name),
+                        *('        self.{0} = {0}'.format(field) for field in arguments)]
+        return _define('class {name}(Base):', name, fields, child, properties, body, {'Base': self.base})
+
+    def from_dict(self, data):
+        return self.cls.from_dict(data)
+
+    def as_json(self, obj):
+        return obj.as_json(recursive=True)
+
+    def copy(self, obj):
+        return obj.copy()
+
+
+class ImmutableVariant(DataObjectVariant):
+    base = ImmutableDataObject
+
+
+class PlainVariant(Variant):
+
+    def define(self, name, fields, child, properties):
+        return _define('class {name}:', name, fields, child, properties)
+
+    def as_json(self, obj):
+        return {key: self.as_json(value) if hasattr(value, '__dict__') else value for key, value in vars(obj).items()}
+
+
+class DataclassVariant(Variant):
+
+    def define(self, name, fields, child, properties):
+        return _define('@dataclass(unsafe_hash=True)\nclass {name}:', name, fields, child, properties, _annotated)
+
+    def as_json(self, obj):
+        return dataclasses.asdict(obj)
+
+    def copy(self, obj):
+        return dataclasses.replace(obj)
+
+
+class NamedTupleVariant(Variant):
+
+    def define(self, name, fields, child, properties):
+        base = namedtuple(name + 'Base', fields + (('child',) if child else ()))
+        return _define('class {name}(Base):\n    __slots__ = ()', name, fields, child, properties,
+                       lambda arguments, child_name: [], {'Base': base})
+
+    def as_json(self, obj):
+        return {key: self.as_json(value) if hasattr(value, '_asdict') else value
+                for key, value in obj._asdict().items()}
+
+    def copy(self, obj):
+        return obj._replace()
+
+
+VARIANTS = {
+    'mutable': DataObjectVariant,
+    'immutable': ImmutableVariant,
+    'plain': PlainVariant,
+    'dataclass': DataclassVariant,
+    'namedtuple': NamedTupleVariant,
+}
+
+
+def _record(fields, depth):
+    record = {'f{0}'.format(index): index for index in range(fields)}
+    if depth:
+        record['child'] = _record(fields, depth - 1)
+    return record
+
+
+def _operations(variant, record):
+    obj = variant.from_dict(record)
+    other = variant.from_dict(record)
+    return {
+        'from_dict': lambda: variant.from_dict(record),
+        'as_json': lambda: variant.as_json(obj),
+        'eq': lambda: obj == other,
+        'hash': lambda: hash(obj),
+        'str': lambda: str(obj),
+        'copy': lambda: variant.copy(obj),
+    }
+
+
+def measure(func, repeat=5, target=0.02) -> float:
+    timer = timeit.Timer(func)
+    number = 1
+    elapsed = timer.timeit(number)
+    while elapsed < target / 10:
+        number *= 10
+        elapsed = timer.timeit(number)
+    number = max(1, int(number * target / elapsed))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def scenarios(sweeps):
+    seen = set()
+    for dimension, values in sweeps.items():
+        for value in values:
+            scenario = {**BASE, dimension: value}
+            key = tuple(scenario.items())
+            if key not in seen:
+                seen.add(key)
+                yield scenario
+
+
+def scenario_name(scenario) -> str:
+    return '/'.join('{0}={1}'.format(key, value) for key, value in scenario.items())
+
+
+def run(sweeps=SWEEPS, variants=tuple(VARIANTS), operations=OPERATIONS, repeat=5, report=None) -> dict:
+    results = {}
+    for scenario in scenarios(sweeps):
+        record = _record(scenario['fields'], scenario['depth'])
+        for variant_name in variants:
+            available = _operations(VARIANTS[variant_name](**scenario), record)
+            for operation in operations:
+                key = '{0}/{1}/{2}'.format(scenario_name(scenario), variant_name, operation)
+                results[key] = measure(available[operation], repeat)
+                if report is not None:
+                    report(key, results[key])
+    return results
+
+
+def compare(current: dict, previous: dict, threshold=DEFAULT_THRESHOLD) -> list:
+    regressions = []
+    for key, seconds in current.items():
+        before = previous.get(key)
+        if VARIANTS[key.split('/')[-2]].baseline:
+            continue
+        if before and seconds / before > 1 + threshold:
+            regressions.append((key, before, seconds))
+    return regressions
+
+
+def _print_result(key, seconds):
+    print('{0:<60} {1:>10.3f} us'.format(key, seconds * 1e6))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--output', help='save results as JSON to this file')
+    parser.add_argument('--compare', help='JSON file with results of previous run')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed slowdown ratio (default {0})'.format(DEFAULT_THRESHOLD))
+    parser.add_argument('--variants', nargs='+', choices=tuple(VARIANTS), default=tuple(VARIANTS))
+    parser.add_argument('--operations', nargs='+', choices=OPERATIONS, default=OPERATIONS)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--quick', action='store_true', help='run smaller sweeps')
+    args = parser.parse_args(argv)
+
+    results = run(QUICK_SWEEPS if args.quick else SWEEPS, args.variants, args.operations, args.repeat,
+                  _print_result)
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump({'python': sys.version, 'platform': platform.platform(), 'timestamp': time.time(),
+                       'results': results}, fp, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as fp:
+            previous = json.load(fp)['results']
+        regressions = compare(results, previous, args.threshold)
+        for key, before, after in regressions:
+            print('REGRESSION {0}: {1:.3f} us -> {2:.3f} us ({3:+.0%})'.format(key, before * 1e6, after * 1e6,
+                                                                              after / before - 1))
+        if regressions:
+            return 1
+        print('No regressions above {0:.0%}'.format(args.threshold))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,3 +1,12 @@
-from .data_object import DataObject, ImmutableDataObject
+from .data_object import DataObject, ImmutableDataObject, SlottedDataObject, ImmutableSlottedDataObject
+from .collection import IndexedCollection
+from .frame import DataObjectFrame
+from .ordering import merge_sorted
+from .parallel import parallel_as_json, parallel_from_dicts
+from .properties import cached_property
+from .serialization import dump_ndjson, load_ndjson
+from .store import DataObjectStore
 
-__all__ = [DataObject, ImmutableDataObject]
+__all__ = [DataObject, ImmutableDataObject, SlottedDataObject, ImmutableSlottedDataObject, IndexedCollection,
+           DataObjectFrame, cached_property, dump_ndjson, load_ndjson, DataObjectStore,
+           parallel_from_dicts, parallel_as_json, merge_sorted]
@@ -0,0 +1,113 @@
+import asyncio
+import inspect
+
+from data_object.exceptions import RecordConversionError
+from data_object.nested import DEFAULT_MAX_DEPTH
+from data_object.serialization import DEFAULT_CHUNK_SIZE, _encoder
+
+DEFAULT_BATCH_SIZE = 500
+
+
+class _End:
+    __slots__ = ('error',)
+
+    def __init__(self, error=None) -> None:
+        self.error = error
+
+
+async def _iterate(items):
+    if hasattr(items, '__aiter__'):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def buffered(items, maxsize):
+    queue = asyncio.Queue(maxsize)
+
+    async def produce():
+        try:
+            async for item in _iterate(items):
+                await queue.put(item)
+        except Exception as err:
+            await queue.put(_End(err))
+        else:
+            await queue.put(_End())
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if isinstance(item, _End):
+                if item.error is not None:
+                    raise item.error
+                return
+            yield item
+    finally:
+        producer.cancel()
+
+
+async def _batches(items, batch_size):
+    batch = []
+    async for item in _iterate(items):
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def abatches_from_dicts(cls, records, batch_size=DEFAULT_BATCH_SIZE, buffer_size=None, none_if_not_found=False,
+                              errors=None, max_depth=DEFAULT_MAX_DEPTH):
+    source = records if buffer_size is None else buffered(records, buffer_size)
+    offset = 0
+    async for batch in _batches(source, batch_size):
+        batch_errors = None if errors is None else []
+        instances = cls.from_dicts(batch, none_if_not_found, batch_errors, max_depth)
+        if batch_errors:
+            errors.extend(RecordConversionError(offset + err.index, err.record, err.cause) for err in batch_errors)
+        offset += len(batch)
+        yield instances
+        await asyncio.sleep(0)
+
+
+async def aiter_from_dicts(cls, records, batch_size=DEFAULT_BATCH_SIZE, buffer_size=None, none_if_not_found=False,
+                           errors=None, max_depth=DEFAULT_MAX_DEPTH):
+    async for instances in abatches_from_dicts(cls, records, batch_size, buffer_size, none_if_not_found, errors,
+                                               max_depth):
+        for instance in instances:
+            yield instance
+
+
+async def adump_ndjson(objects, writer, chunk_size=DEFAULT_CHUNK_SIZE, default=None, buffer_size=None,
+                       binary=None) -> int:
+    encode = _encoder(default).encode
+    source = objects if buffer_size is None else buffered(objects, buffer_size)
+    if binary is None:
+        binary = isinstance(writer, asyncio.StreamWriter)
+    count = 0
+    lines = []
+    async for obj in _iterate(source):
+        lines.append(encode(obj))
+        count += 1
+        if len(lines) >= chunk_size:
+            await _write_lines(writer, lines, binary)
+            lines = []
+    if lines:
+        await _write_lines(writer, lines, binary)
+    return count
+
+
+async def _write_lines(writer, lines, binary) -> None:
+    chunk = '\n'.join(lines) + '\n'
+    result = writer.write(chunk.encode('utf-8') if binary else chunk)
+    if inspect.isawaitable(result):
+        await result
+    drain = getattr(writer, 'drain', None)
+    if drain is not None:
+        await drain()
+    else:
+        await asyncio.sleep(0)
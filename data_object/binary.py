@@ -0,0 +1,158 @@
+from struct import Struct, error as StructError
+from typing import Union, get_args, get_origin
+from zlib import crc32
+
+from data_object.exceptions import BinarySchemaError
+from data_object.nested import field_types, is_data_object_class
+from data_object.schema import schema_of
+
+try:
+    from types import UnionType
+except ImportError:
+    UnionType = Union
+
+FIXED_CODES = {int: 'q', float: 'd', bool: '?'}
+LENGTH_PREFIX = Struct('<I')
+
+
+def _field_kind(tp):
+    if get_origin(tp) in (Union, UnionType):
+        args = [arg for arg in get_args(tp) if arg is not type(None)]
+        if len(args) == 1:
+            return _field_kind(args[0])
+    if tp in FIXED_CODES or tp in (str, bytes):
+        return tp
+    if is_data_object_class(tp):
+        return tp
+    return None
+
+
+class BinarySchema:
+
+    def __init__(self, cls) -> None:
+        self.cls = cls
+        types = field_types(cls)
+        fixed, variable = [], []
+        for field in schema_of(cls).args:
+            kind = _field_kind(types.get(field))
+            if kind is None:
+                raise BinarySchemaError('Field {0} of {1} has no binary representation'.format(field, cls.__name__))
+            (fixed if kind in FIXED_CODES else variable).append((field, kind))
+        self.fields = tuple(field for field, _ in fixed + variable)
+        self.fixed = tuple(fixed)
+        self.variable = tuple(variable)
+        self.bitmap_size = (len(self.fields) + 7) // 8
+        self.header = Struct('<{0}s{1}{2}'.format(self.bitmap_size, ''.join(FIXED_CODES[kind] for _, kind in fixed),
+                                                  'I' * len(variable)))
+        self.view_class = None
+        self.fingerprint = crc32(';'.join('{0}:{1}'.format(field, _kind_name(kind)) for field, kind in
+                                          fixed + variable).encode('utf-8'))
+
+    def pack(self, obj) -> bytes:
+        bitmap = 0
+        bit = 1
+        fixed_values = []
+        lengths = []
+        chunks = []
+        for field, kind in self.fixed:
+            value = getattr(obj, field)
+            if value is None:
+                bitmap |= bit
+                value = kind()
+            fixed_values.append(value)
+            bit <<= 1
+        for field, kind in self.variable:
+            value = getattr(obj, field)
+            if value is None:
+                bitmap |= bit
+                value = b''
+            elif kind is str:
+                if not isinstance(value, str):
+                    raise self._value_error(field, value, kind)
+                value = value.encode('utf-8')
+            elif kind is bytes:
+                if not isinstance(value, (bytes, bytearray)):
+                    raise self._value_error(field, value, kind)
+            else:
+                value = binary_schema_of(kind).pack(value)
+            lengths.append(len(value))
+            chunks.append(value)
+            bit <<= 1
+        try:
+            header = self.header.pack(bitmap.to_bytes(self.bitmap_size, 'little'), *fixed_values, *lengths)
+        except StructError as err:
+            for (field, kind), value in zip(self.fixed, fixed_values):
+                try:
+                    Struct('<' + FIXED_CODES[kind]).pack(value)
+                except StructError:
+                    raise self._value_error(field, value, kind) from err
+            raise BinarySchemaError('Cannot pack {0}: {1}'.format(self.cls.__name__, err)) from err
+        return header + b''.join(chunks)
+
+    def _value_error(self, field, value, kind) -> BinarySchemaError:
+        return BinarySchemaError('Value {0!r} of field {1} of {2} cannot be packed as {3}'.format(
+            value, field, self.cls.__name__, kind.__name__))
+
+    def unpack_values(self, buffer, offset=0) -> dict:
+        header = self.header.unpack_from(buffer, offset)
+        bitmap = int.from_bytes(header[0], 'little')
+        values = {}
+        bit = 1
+        for (field, _), value in zip(self.fixed, header[1:]):
+            values[field] = None if bitmap & bit else value
+            bit <<= 1
+        position = offset + self.header.size
+        for (field, kind), length in zip(self.variable, header[1 + len(self.fixed):]):
+            if bitmap & bit:
+                values[field] = None
+            else:
+                chunk = buffer[position:position + length]
+                if kind is str:
+                    values[field] = str(chunk, 'utf-8')
+                elif kind is bytes:
+                    values[field] = bytes(chunk)
+                else:
+                    values[field] = binary_schema_of(kind).unpack(chunk)
+            position += length
+            bit <<= 1
+        return values
+
+    def unpack(self, buffer, offset=0):
+        # noinspection PyArgumentList
+        return self.cls(**self.unpack_values(buffer, offset))
+
+    def pack_many(self, objects) -> bytes:
+        chunks = []
+        for obj in objects:
+            record = self.pack(obj)
+            chunks.append(LENGTH_PREFIX.pack(len(record)))
+            chunks.append(record)
+        return b''.join(chunks)
+
+    def iter_unpack_many(self, buffer):
+        view = memoryview(buffer)
+        position = 0
+        while position < len(view):
+            length, = LENGTH_PREFIX.unpack_from(view, position)
+            position += LENGTH_PREFIX.size
+            yield self.unpack(view, position)
+            position += length
+
+
+def _kind_name(kind) -> str:
+    return kind.__name__ if kind in FIXED_CODES or kind in (str, bytes) else 'object:' + kind.__name__
+
+
+def binary_schema_of(cls) -> BinarySchema:
+    schema = schema_of(cls)
+    if schema.binary is None:
+        schema.binary = BinarySchema(cls)
+    return schema.binary
+
+
+def unpack_object(cls, data):
+    return binary_schema_of(cls).unpack(data)
+
+
+def compact_reduce_ex(self, protocol):
+    return unpack_object, (self.__class__, binary_schema_of(self.__class__).pack(self))
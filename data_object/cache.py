@@ -0,0 +1,135 @@
+import atexit
+import marshal
+import os
+from functools import lru_cache
+from hashlib import sha1
+from importlib.util import MAGIC_NUMBER
+from types import CodeType
+
+_FORMAT = (b'DOC2', MAGIC_NUMBER)
+
+
+class SchemaCache:
+
+    def __init__(self, path) -> None:
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._code = {}
+        self._facts = {}
+        self._dirty = False
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with open(self.path, 'rb') as fp:
+                data = marshal.load(fp)
+        except (OSError, EOFError, ValueError, TypeError):
+            return
+        if not isinstance(data, dict) or data.get('format') != _FORMAT:
+            return
+        self._code.update(data['code'])
+        self._facts.update(data['facts'])
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        temporary = '{0}.{1}.tmp'.format(self.path, os.getpid())
+        with open(temporary, 'wb') as fp:
+            marshal.dump({'format': _FORMAT, 'code': self._code, 'facts': self._facts}, fp)
+        os.replace(temporary, self.path)
+        self._dirty = False
+
+    def code(self, source, filename):
+        key = sha1('{0}\0{1}'.format(filename, source).encode('utf-8')).hexdigest()
+        data = self._code.get(key)
+        if data is not None:
+            self.hits += 1
+            return marshal.loads(data)
+        self.misses += 1
+        code = compile(source, filename, 'exec')
+        self._code[key] = marshal.dumps(code)
+        self._dirty = True
+        return code
+
+    def fact(self, kind, key, compute):
+        entry = (kind, key)
+        try:
+            value = self._facts[entry]
+        except KeyError:
+            self.misses += 1
+            value = self._facts[entry] = compute()
+            self._dirty = True
+        else:
+            self.hits += 1
+        return value
+
+    def stats(self) -> dict:
+        return {'code': len(self._code), 'facts': len(self._facts), 'hits': self.hits, 'misses': self.misses}
+
+
+_cache = None
+_lazy = False
+
+
+def configure(path=None, lazy=False, save_at_exit=True):
+    global _cache, _lazy
+    if _cache is not None:
+        _cache.save()
+    _cache = SchemaCache(path) if path is not None else None
+    _lazy = bool(lazy)
+    if _cache is not None and save_at_exit:
+        atexit.register(_cache.save)
+    return _cache
+
+
+def active_cache():
+    return _cache
+
+
+def is_lazy() -> bool:
+    return _lazy
+
+
+def save() -> None:
+    if _cache is not None:
+        _cache.save()
+
+
+@lru_cache(maxsize=1024)
+def _compile(source, filename):
+    return compile(source, filename, 'exec')
+
+
+def compile_source(source, filename):
+    if _cache is None:
+        return _compile(source, filename)
+    return _cache.code(source, filename)
+
+
+def code_key(code, *extra) -> str:
+    digest = sha1()
+    _update_digest(digest, code)
+    digest.update(repr(extra).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _update_digest(digest, code) -> None:
+    digest.update(code.co_code)
+    constants = []
+    for constant in code.co_consts:
+        if isinstance(constant, CodeType):
+            _update_digest(digest, constant)
+            constants.append(CodeType)
+        else:
+            constants.append(constant)
+    digest.update(repr((constants, code.co_names, code.co_varnames, code.co_argcount, code.co_kwonlyargcount,
+                        code.co_flags)).encode('utf-8'))
+
+
+def cached_fact(kind, key, compute):
+    if _cache is None:
+        return compute()
+    return _cache.fact(kind, key, compute)
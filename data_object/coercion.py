@@ -0,0 +1,123 @@
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID
+
+STRICT = 'strict'
+LENIENT = 'lenient'
+COERCION_ERRORS = (ValueError, TypeError, ArithmeticError)
+
+_TRUE = frozenset(('true', '1', 'yes', 'y', 'on', 't'))
+_FALSE = frozenset(('false', '0', 'no', 'n', 'off', 'f'))
+
+
+def coercion_mode(coerce):
+    if coerce is None or coerce is False:
+        return None
+    if coerce is True:
+        return STRICT
+    if coerce not in (STRICT, LENIENT):
+        raise ValueError('Unknown coercion mode: {0}'.format(coerce))
+    return coerce
+
+
+def _to_int(value):
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError('{0!r} is not integral'.format(value))
+    if isinstance(value, (str, bytes, float, Decimal, bool)):
+        return int(value)
+    raise TypeError('Cannot convert {0} to int'.format(type(value).__name__))
+
+
+def _to_float(value):
+    if isinstance(value, (str, bytes, int, Decimal)):
+        return float(value)
+    raise TypeError('Cannot convert {0} to float'.format(type(value).__name__))
+
+
+def _to_bool(value):
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE:
+            return True
+        if lowered in _FALSE:
+            return False
+    elif isinstance(value, (int, float, Decimal)) and value in (0, 1):
+        return bool(value)
+    raise ValueError('{0!r} is not a boolean value'.format(value))
+
+
+def _to_str(value):
+    if isinstance(value, (int, float, Decimal, UUID, Enum)):
+        return str(value.value if isinstance(value, Enum) else value)
+    raise TypeError('Cannot convert {0} to str'.format(type(value).__name__))
+
+
+def _to_decimal(value):
+    if isinstance(value, float):
+        return Decimal(repr(value))
+    if isinstance(value, (str, int)):
+        return Decimal(value)
+    raise TypeError('Cannot convert {0} to Decimal'.format(type(value).__name__))
+
+
+def _to_datetime(value):
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return datetime.fromtimestamp(value, timezone.utc)
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    raise TypeError('Cannot convert {0} to datetime'.format(type(value).__name__))
+
+
+def _to_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    raise TypeError('Cannot convert {0} to date'.format(type(value).__name__))
+
+
+def _to_time(value):
+    if isinstance(value, str):
+        return time.fromisoformat(value)
+    raise TypeError('Cannot convert {0} to time'.format(type(value).__name__))
+
+
+def _to_uuid(value):
+    if isinstance(value, str):
+        return UUID(value)
+    if isinstance(value, bytes):
+        return UUID(bytes=value)
+    raise TypeError('Cannot convert {0} to UUID'.format(type(value).__name__))
+
+
+_CONVERTERS = {
+    int: _to_int,
+    float: _to_float,
+    bool: _to_bool,
+    str: _to_str,
+    Decimal: _to_decimal,
+    datetime: _to_datetime,
+    date: _to_date,
+    time: _to_time,
+    UUID: _to_uuid,
+}
+
+
+def _enum_converter(tp):
+    def convert(value):
+        try:
+            return tp(value)
+        except ValueError:
+            if isinstance(value, str) and value in tp.__members__:
+                return tp[value]
+            raise
+    return convert
+
+
+def compile_converter(tp):
+    if isinstance(tp, type) and issubclass(tp, Enum):
+        return _enum_converter(tp)
+    return _CONVERTERS.get(tp)
@@ -0,0 +1,111 @@
+from bisect import bisect_left, bisect_right, insort
+from itertools import count
+
+from data_object.data_object import ImmutableDataObject
+
+_MAX_SEQUENCE = float('inf')
+
+
+class IndexedCollection:
+
+    def __init__(self, data_class, hash_fields=(), sorted_fields=(), items=()) -> None:
+        self.data_class = data_class
+        self.hash_fields = tuple(hash_fields)
+        self.sorted_fields = tuple(sorted_fields)
+        self._fields = tuple(dict.fromkeys(self.hash_fields + self.sorted_fields))
+        self._immutable = issubclass(data_class, ImmutableDataObject)
+        self._items = {}
+        self._snapshots = {}
+        self._sequences = {}
+        self._counter = count()
+        self._hash_indexes = {field: {} for field in self.hash_fields}
+        self._sorted_indexes = {field: [] for field in self.sorted_fields}
+        for item in items:
+            self.add(item)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(list(self._items.values()))
+
+    def __contains__(self, item) -> bool:
+        return self._key(item) in self._items
+
+    def _key(self, item):
+        return item if self._immutable else id(item)
+
+    def _indexed_values(self, item) -> dict:
+        return {field: getattr(item, field) for field in self._fields}
+
+    def add(self, item) -> None:
+        key = self._key(item)
+        if key in self._items:
+            return
+        values = self._indexed_values(item)
+        sequence = next(self._counter)
+        for field in self.hash_fields:
+            hash(values[field])
+        positions = [(index, bisect_right(index, (values[field], sequence)), (values[field], sequence, item))
+                     for field, index in self._sorted_indexes.items() if values[field] is not None]
+        for field, index in self._hash_indexes.items():
+            index.setdefault(values[field], {})[key] = item
+        for index, position, entry in positions:
+            index.insert(position, entry)
+        self._items[key] = item
+        self._sequences[key] = sequence
+        if not self._immutable:
+            self._snapshots[key] = values
+
+    def remove(self, item) -> None:
+        key = self._key(item)
+        if key not in self._items:
+            raise KeyError(item)
+        stored = self._items.pop(key)
+        values = self._indexed_values(stored) if self._immutable else self._snapshots.pop(key)
+        sequence = self._sequences.pop(key)
+        for field, index in self._hash_indexes.items():
+            bucket = index[values[field]]
+            del bucket[key]
+            if not bucket:
+                del index[values[field]]
+        for field, index in self._sorted_indexes.items():
+            if values[field] is not None:
+                del index[bisect_left(index, (values[field], sequence))]
+
+    def discard(self, item) -> None:
+        if item in self:
+            self.remove(item)
+
+    def reindex(self, item) -> None:
+        self.remove(item)
+        self.add(item)
+
+    def find(self, **conditions) -> list:
+        indexed = [field for field in conditions if field in self._hash_indexes]
+        if indexed:
+            field = indexed[0]
+            candidates = self._hash_indexes[field].get(conditions[field], {}).values()
+        elif any(field in self._sorted_indexes and value is not None for field, value in conditions.items()):
+            field = next(field for field, value in conditions.items()
+                         if field in self._sorted_indexes and value is not None)
+            candidates = self.range(field, conditions[field], conditions[field])
+        else:
+            field = None
+            candidates = self._items.values()
+        if not self._immutable:
+            field = None
+        rest = [(name, value) for name, value in conditions.items() if name != field]
+        return [item for item in candidates if all(getattr(item, name) == value for name, value in rest)]
+
+    def range(self, field, low=None, high=None, include_low=True, include_high=True) -> list:
+        index = self._sorted_indexes[field]
+        if low is None:
+            start = 0
+        else:
+            start = bisect_left(index, (low,)) if include_low else bisect_right(index, (low, _MAX_SEQUENCE))
+        if high is None:
+            end = len(index)
+        else:
+            end = bisect_right(index, (high, _MAX_SEQUENCE)) if include_high else bisect_left(index, (high,))
+        return [entry[2] for entry in index[start:end]]
@@ -1,41 +1,282 @@
 from abc import ABCMeta
 from functools import reduce
-from inspect import getfullargspec, signature, _empty, ismethod
+from types import MethodType
 
-from copy import deepcopy
+from data_object.binary import binary_schema_of, compact_reduce_ex
+from data_object.cache import is_lazy
+from data_object.coercion import coercion_mode
+from data_object.exceptions import ChangeTrackingError, ConstructorKeywordArgumentNotFound, \
+    ImmutableObjectViolation, RecordConversionError, UnknownFieldError
+from data_object.instrumentation import instrument_class
+from data_object.interning import DEFAULT_INTERN_LIMIT, INTERN_ATTR, InternTable, intern_key, intern_table_of
+from data_object.nested import DEFAULT_MAX_DEPTH, LoadContext, dump_value, load_object, loaders_of
+from data_object.ordering import install_ordering, order_fields
+from data_object.properties import CACHE_ATTR, FROZEN_ATTR, HASH_ATTR, JSON_ATTR, REPR_ATTR
+from data_object.rows import DEFAULT_FETCH_SIZE, compile_row_loader, iter_cursor_rows
+from data_object.schema import COERCE_ATTR, COMPARED_ATTR, PROPERTIES_ATTR, SCHEMA_ATTR, schema_of, \
+    invalidate_schema, derive_slots, update_class_value
+from data_object.serialization import to_json
+from data_object.specialize import SPECIALIZED_ATTR, specialize, specialize_lazily
+from data_object.views import iter_views, view_class_of
 
-from data_object.exceptions import ConstructorKeywordArgumentNotFound, ImmutableObjectViolation
+SLOTTED_ATTR = '_DataObject__slotted'
+TRACKED_ATTR = '_DataObject__track_changes'
+CHANGES_ATTR = '_DataObject__changes'
 
 
-class DataObject(metaclass=ABCMeta):
+_UNTRACKED_ATTRS = frozenset((SCHEMA_ATTR, SPECIALIZED_ATTR, TRACKED_ATTR, '__abstractmethods__', '_abc_impl'))
+_FIELD_ATTRS = frozenset(('__init__', '__fields__', PROPERTIES_ATTR, COMPARED_ATTR))
 
-    def as_json(self):
-        members = {**self.__class__.__dict__, **self.__dict__}
-        return {key: getattr(self, key) for key in members.keys() if
-                not ismethod(getattr(self, key)) and not key.startswith('_')}
 
-    @classmethod
-    def from_dict(cls, params: dict, none_if_not_found=False):
-        constructor_args = deepcopy(getfullargspec(cls.__init__).args)
-        del constructor_args[0]
-        kwargs = {}
-        for arg in constructor_args:
+class DataObjectMeta(ABCMeta):
+
+    def __new__(mcls, name, bases, namespace, **kwargs):
+        if '__slots__' not in namespace and any(getattr(base, SLOTTED_ATTR, False) for base in bases):
+            extra = (CHANGES_ATTR,) if kwargs.get('track_changes') else ()
+            if kwargs.get('interned') and not any(base.__weakrefoffset__ for base in bases):
+                extra += ('__weakref__',)
+            namespace['__slots__'] = derive_slots(bases, namespace, extra)
+        return super().__new__(mcls, name, bases, namespace, **kwargs)
+
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+        if name not in _UNTRACKED_ATTRS and not update_class_value(cls, name, value):
+            cls.__refresh(name)
+
+    def __delattr__(cls, name):
+        super().__delattr__(name)
+        cls.__refresh(name)
+
+    def __refresh(cls, name):
+        respecialize = not name.startswith('_') or name in _FIELD_ATTRS
+        for klass in invalidate_schema(cls):
+            if respecialize and klass.__dict__.get(SPECIALIZED_ATTR, False):
+                specialize_lazily(klass, DataObject)
+                instrument_class(klass)
+
+
+class DataObject(metaclass=DataObjectMeta):
+    __slots__ = ()
+    __schema = None
+    __specialized = False
+    __slotted = False
+    __track_changes = False
+
+    def __init_subclass__(cls, specialized=None, compact_pickle=None, track_changes=None, properties=None,
+                          compare_properties=None, order=None, coerce=None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if coerce is not None:
+            type.__setattr__(cls, COERCE_ATTR, coercion_mode(coerce))
+        if order is not None:
+            install_ordering(cls, order_fields(order))
+        if properties is not None:
+            type.__setattr__(cls, PROPERTIES_ATTR, _property_names(properties))
+        if compare_properties is not None:
+            type.__setattr__(cls, COMPARED_ATTR, _property_names(compare_properties))
+        if track_changes is not None and track_changes != cls.__track_changes:
+            cls.__track_changes = bool(track_changes)
+            cls.__setattr__ = _tracking_setattr(cls) if track_changes else object.__setattr__
+        if compact_pickle is not None:
+            cls.__reduce_ex__ = compact_reduce_ex if compact_pickle else object.__reduce_ex__
+        cls.__specialized = bool(cls.__specialized if specialized is None else specialized)
+        if cls.__specialized:
+            (specialize_lazily if is_lazy() else specialize)(cls, DataObject)
+        instrument_class(cls)
+
+    def as_json(self, recursive=False, max_depth=DEFAULT_MAX_DEPTH):
+        if recursive:
+            return dump_value(self, max_depth)
+        schema = schema_of(self.__class__)
+        return self.__values(schema, schema.class_properties)
+
+    def _comparison_values(self) -> dict:
+        schema = schema_of(self.__class__)
+        return self.__values(schema, schema.compared_properties)
+
+    def __values(self, schema, properties) -> dict:
+        values = schema.class_values.copy()
+        for key in schema.class_properties:
+            if key not in properties:
+                del values[key]
+                continue
+            value = getattr(self, key)
+            if isinstance(value, MethodType):
+                del values[key]
+            else:
+                values[key] = value
+        for key in schema.slots:
             try:
-                kwargs[arg] = params[arg]
-            except KeyError as err:
-                default_val = signature(cls.__init__).parameters.get(arg).default
-                if default_val is not _empty:
-                    kwargs[arg] = default_val
-                elif none_if_not_found:
-                    kwargs[arg] = None
-                else:
-                    raise ConstructorKeywordArgumentNotFound(err)
+                value = getattr(self, key)
+            except AttributeError:
+                continue
+            if not isinstance(value, MethodType):
+                values[key] = value
+        if not schema.instance_dict:
+            return values
+        descriptors = schema.data_descriptors
+        for key, value in self.__dict__.items():
+            if key.startswith('_') or key in schema.class_properties or key in schema.hidden_properties:
+                continue
+            if key in descriptors:
+                value = getattr(self, key)
+            if isinstance(value, MethodType):
+                values.pop(key, None)
+            else:
+                values[key] = value
+        return values
+
+    def to_json(self, as_bytes=False):
+        return to_json(self, as_bytes)
+
+    def to_bytes(self) -> bytes:
+        return binary_schema_of(self.__class__).pack(self)
+
+    @classmethod
+    def from_bytes(cls, data):
+        return binary_schema_of(cls).unpack(data)
+
+    @classmethod
+    def to_bytes_many(cls, objects) -> bytes:
+        return binary_schema_of(cls).pack_many(objects)
+
+    @classmethod
+    def from_bytes_many(cls, data) -> list:
+        return list(binary_schema_of(cls).iter_unpack_many(data))
+
+    @classmethod
+    def view(cls, buffer, offset=0):
+        return view_class_of(cls)(buffer, offset)
+
+    @classmethod
+    def iter_views(cls, buffer):
+        return iter_views(cls, buffer)
+
+    @classmethod
+    def from_dict(cls, params: dict, none_if_not_found=False, max_depth=DEFAULT_MAX_DEPTH):
+        schema = schema_of(cls)
+        if loaders_of(schema):
+            return load_object(cls, params, LoadContext(none_if_not_found, max_depth))
+        try:
+            kwargs = {arg: params[arg] for arg in schema.args}
+        except KeyError:
+            kwargs = schema.constructor_kwargs(params, none_if_not_found)
         # noinspection PyArgumentList
         return cls(**kwargs)
 
+    @classmethod
+    def from_dicts(cls, records, none_if_not_found=False, errors=None, max_depth=DEFAULT_MAX_DEPTH) -> list:
+        return list(cls.iter_from_dicts(records, none_if_not_found, errors, max_depth))
+
+    @classmethod
+    def iter_from_dicts(cls, records, none_if_not_found=False, errors=None, max_depth=DEFAULT_MAX_DEPTH):
+        schema = schema_of(cls)
+        args = schema.args
+        context = LoadContext(none_if_not_found, max_depth) if loaders_of(schema) else None
+        for index, params in enumerate(records):
+            try:
+                if context is not None:
+                    instance = load_object(cls, params, context)
+                else:
+                    try:
+                        kwargs = {arg: params[arg] for arg in args}
+                    except KeyError:
+                        kwargs = schema.constructor_kwargs(params, none_if_not_found)
+                    # noinspection PyArgumentList
+                    instance = cls(**kwargs)
+            except Exception as err:
+                if errors is None:
+                    raise
+                errors.append(RecordConversionError(index, params, err))
+                continue
+            yield instance
+
+    @classmethod
+    def from_rows(cls, rows, columns, none_if_not_found=False, errors=None, max_depth=DEFAULT_MAX_DEPTH) -> list:
+        return list(cls.iter_from_rows(rows, columns, none_if_not_found, errors, max_depth))
+
+    @classmethod
+    def iter_from_rows(cls, rows, columns, none_if_not_found=False, errors=None, max_depth=DEFAULT_MAX_DEPTH):
+        load = compile_row_loader(cls, columns, none_if_not_found, LoadContext(none_if_not_found, max_depth))
+        if errors is None:
+            yield from map(load, rows)
+            return
+        for index, row in enumerate(rows):
+            try:
+                instance = load(row)
+            except Exception as err:
+                errors.append(RecordConversionError(index, row, err))
+                continue
+            yield instance
+
+    @classmethod
+    def iter_from_cursor(cls, cursor, fetch_size=DEFAULT_FETCH_SIZE, none_if_not_found=False, errors=None,
+                         max_depth=DEFAULT_MAX_DEPTH):
+        return cls.iter_from_rows(iter_cursor_rows(cursor, fetch_size), cursor.description, none_if_not_found, errors,
+                                  max_depth)
+
     def copy(self, **attributes):
-        attrs = {**self.as_json(), **attributes}
-        return type(self).from_dict(attrs)
+        return self.__copy_with(attributes)
+
+    def evolve(self, **changes):
+        unknown = changes.keys() - schema_of(self.__class__).args
+        if unknown:
+            raise UnknownFieldError(unknown)
+        return self.__copy_with(changes)
+
+    def __copy_with(self, changes):
+        cls = self.__class__
+        schema = schema_of(cls)
+        values = {}
+        for arg in schema.args:
+            if arg in changes:
+                values[arg] = changes[arg]
+                continue
+            try:
+                values[arg] = getattr(self, arg)
+            except AttributeError:
+                if arg not in schema.defaults:
+                    raise ConstructorKeywordArgumentNotFound(KeyError(arg))
+        return cls._from_values(values)
+
+    @classmethod
+    def _from_values(cls, values: dict):
+        schema = schema_of(cls)
+        if not schema.plain_init or len(values) != len(schema.args) or intern_table_of(cls) is not None:
+            # noinspection PyArgumentList
+            return cls(**values)
+        instance = cls.__new__(cls)
+        if schema.dict_state:
+            instance.__dict__.update(values)
+        else:
+            for name, value in values.items():
+                object.__setattr__(instance, name, value)
+        instance._finish_construction()
+        return instance
+
+    def _finish_construction(self):
+        pass
+
+    def changed_fields(self) -> frozenset:
+        if not self.__track_changes:
+            raise ChangeTrackingError('Change tracking not enabled for {0}'.format(self.__class__.__name__))
+        return frozenset(getattr(self, CHANGES_ATTR, None) or ())
+
+    def checkpoint(self) -> None:
+        if not self.__track_changes:
+            raise ChangeTrackingError('Change tracking not enabled for {0}'.format(self.__class__.__name__))
+        object.__setattr__(self, CHANGES_ATTR, None)
+
+    def to_patch(self) -> dict:
+        return {name: getattr(self, name) for name in self.changed_fields() if hasattr(self, name)}
+
+    def apply_patch(self, patch: dict):
+        for name, value in patch.items():
+            setattr(self, name, value)
+        return self
+
+    def diff(self, other) -> dict:
+        values = self.as_json()
+        return {key: value for key, value in other.as_json().items() if key not in values or values[key] != value}
 
     def __str__(self) -> str:
         attr_values = self.as_json()
@@ -50,25 +291,156 @@ class DataObject(metaclass=ABCMeta):
         return '{0}({1})'.format(self.__class__.__name__, ', '.join(pairs))
 
     def __eq__(self, o: object) -> bool:
+        if self is o:
+            return True
         if not hasattr(o, 'as_json'):
             return False
+        if isinstance(o, DataObject):
+            if o.__class__ is not self.__class__ and (self.__specialized or o.__specialized):
+                return False
+            return self._comparison_values() == o._comparison_values()
         return self.as_json() == o.as_json()
 
     def __ne__(self, o: object) -> bool:
         return not self.__eq__(o)
 
     def __hash__(self) -> int:
-        attr_values = sorted("{0}:{1}".format(key, value) for key, value in self.as_json().items())
+        attr_values = sorted("{0}:{1}".format(key, value) for key, value in self._comparison_values().items())
         hashes = reduce(lambda prev_attr, next_attr: hash(prev_attr) ^ hash(next_attr), attr_values, 0)
         return hashes
 
 
-class ImmutableDataObject(DataObject):
+def _property_names(properties):
+    if properties is True:
+        return None
+    if properties is False:
+        return frozenset()
+    return frozenset((properties,) if isinstance(properties, str) else properties)
+
+
+def _tracking_setattr(cls):
+    parent_setattr = next(klass.__dict__['__setattr__'] for klass in cls.__mro__[1:] if '__setattr__' in klass.__dict__)
+
+    def __setattr__(self, name, value):
+        parent_setattr(self, name, value)
+        if not name.startswith('_'):
+            changes = getattr(self, CHANGES_ATTR, None)
+            if changes is None:
+                object.__setattr__(self, CHANGES_ATTR, {name})
+            else:
+                changes.add(name)
+    return __setattr__
+
+
+class ImmutableDataObjectMeta(DataObjectMeta):
+
+    def __call__(cls, *args, **kwargs):
+        table = intern_table_of(cls)
+        if table is None:
+            instance = super().__call__(*args, **kwargs)
+            instance._finish_construction()
+            return instance
+        key = intern_key(schema_of(cls), args, kwargs)
+        if key is not None:
+            instance = table.get(key)
+            if instance is not None:
+                return instance
+        instance = super().__call__(*args, **kwargs)
+        instance._finish_construction()
+        if key is not None:
+            table.add(key, instance)
+        return instance
+
+
+class ImmutableDataObject(DataObject, metaclass=ImmutableDataObjectMeta):
+    __slots__ = ()
+    __frozen = False
+    __hash = None
+    __json = None
+    __repr = None
+    __cache = None
+
+    def __init_subclass__(cls, interned=None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if interned is None:
+            inherited = next((intern_table_of(klass) for klass in cls.__mro__[1:]
+                              if intern_table_of(klass) is not None), None)
+            interned = inherited.limit if inherited is not None else None
+        if interned:
+            limit = DEFAULT_INTERN_LIMIT if interned is True else interned
+            type.__setattr__(cls, INTERN_ATTR, InternTable(limit))
+
+    @classmethod
+    def intern_stats(cls):
+        table = intern_table_of(cls)
+        return None if table is None else table.stats()
+
+    def as_json(self, recursive=False, max_depth=DEFAULT_MAX_DEPTH):
+        if recursive:
+            return super().as_json(recursive, max_depth)
+        values = self.__json
+        if values is None:
+            values = super().as_json()
+            if not self.__frozen:
+                return values
+            object.__setattr__(self, JSON_ATTR, values)
+        return values.copy()
+
+    def __repr__(self) -> str:
+        value = self.__repr
+        if value is None:
+            value = super().__repr__()
+            if self.__frozen:
+                object.__setattr__(self, REPR_ATTR, value)
+        return value
+
+    def __hash__(self) -> int:
+        value = self.__hash
+        if value is None:
+            value = super().__hash__()
+            if self.__frozen:
+                object.__setattr__(self, HASH_ATTR, value)
+        return value
 
     def __setattr__(self, name: str, value) -> None:
-        try:
-            getattr(self, name)
-        except AttributeError:
-            super().__setattr__(name, value)
-            return
-        raise ImmutableObjectViolation('Changing attributes not permitted for immutable object')
+        if self.__frozen:
+            raise ImmutableObjectViolation('Changing attributes not permitted for immutable object')
+        super().__setattr__(name, value)
+
+    def _finish_construction(self):
+        object.__setattr__(self, FROZEN_ATTR, True)
+
+    def apply_patch(self, patch: dict):
+        return self.copy(**patch)
+
+    def __setstate__(self, state) -> None:
+        instance_state, slots_state = state if isinstance(state, tuple) else (state, None)
+        for name, value in {**(instance_state or {}), **(slots_state or {})}.items():
+            if name not in (FROZEN_ATTR, HASH_ATTR, JSON_ATTR, REPR_ATTR, CACHE_ATTR):
+                object.__setattr__(self, name, value)
+        object.__setattr__(self, FROZEN_ATTR, True)
+
+    __hash__.__cached__ = True
+    __repr__.__cached__ = True
+    __setattr__.__bypassable__ = True
+
+
+class SlottedDataObject(DataObject):
+    __slots__ = ()
+    _DataObject__slotted = True
+
+
+class ImmutableSlottedDataObject(SlottedDataObject, ImmutableDataObject):
+    __slots__ = (FROZEN_ATTR, HASH_ATTR, CACHE_ATTR)
+
+    def __new__(cls, *args, **kwargs):
+        instance = super().__new__(cls)
+        object.__setattr__(instance, FROZEN_ATTR, False)
+        object.__setattr__(instance, HASH_ATTR, None)
+        object.__setattr__(instance, CACHE_ATTR, None)
+        return instance
+
+    __new__.__bypassable__ = True
+
+    as_json = DataObject.as_json
+    __repr__ = DataObject.__repr__
@@ -9,3 +9,50 @@ class ConstructorKeywordArgumentNotFound(DataObjectException):
 
 class ImmutableObjectViolation(DataObjectException):
     pass
+
+
+class RecordConversionError(DataObjectException):
+    def __init__(self, index, record, cause) -> None:
+        super().__init__('Record {0} could not be converted: {1}'.format(index, cause))
+        self.index = index
+        self.record = record
+        self.cause = cause
+
+
+class NestingTooDeepError(DataObjectException):
+    def __init__(self, max_depth) -> None:
+        super().__init__('Nesting deeper than {} levels'.format(max_depth))
+        self.max_depth = max_depth
+
+
+class CyclicReferenceError(DataObjectException):
+    pass
+
+
+class UnknownFieldError(DataObjectException):
+    def __init__(self, fields) -> None:
+        super().__init__('Unknown fields: {}'.format(', '.join(sorted(fields))))
+        self.fields = fields
+
+
+class BinarySchemaError(DataObjectException):
+    pass
+
+
+class StoreError(DataObjectException):
+    pass
+
+
+class ChangeTrackingError(DataObjectException):
+    pass
+
+
+class CoercionError(DataObjectException, ValueError):
+    def __init__(self, class_name, errors: dict) -> None:
+        super().__init__('Invalid values for {0}: {1}'.format(
+            class_name, '; '.join('{0} ({1})'.format(field, error) for field, error in errors.items())))
+        self.class_name = class_name
+        self.errors = errors
+
+    def __reduce__(self):
+        return self.__class__, (self.class_name, self.errors)
@@ -0,0 +1,111 @@
+import operator
+from array import array
+
+from data_object.schema import schema_of
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_OPERATORS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
+_ORDERING = frozenset(('<', '<=', '>', '>='))
+
+
+def _make_column(values: list):
+    if values and all(type(value) is int for value in values):
+        try:
+            return numpy.array(values, dtype=numpy.int64) if numpy else array('q', values)
+        except OverflowError:
+            return values
+    if values and all(type(value) is float for value in values):
+        return numpy.array(values, dtype=numpy.float64) if numpy else array('d', values)
+    return values
+
+
+def _take(column, indices):
+    if numpy is not None and isinstance(column, numpy.ndarray):
+        return column[numpy.asarray(indices, dtype=numpy.intp)]
+    if isinstance(column, array):
+        return array(column.typecode, [column[index] for index in indices])
+    return [column[index] for index in indices]
+
+
+def _to_list(column) -> list:
+    return column.tolist() if hasattr(column, 'tolist') else list(column)
+
+
+class DataObjectFrame:
+
+    def __init__(self, data_class, columns: dict) -> None:
+        self.data_class = data_class
+        self.fields = tuple(columns)
+        self._columns = columns
+        self._length = len(next(iter(columns.values()))) if columns else 0
+
+    @classmethod
+    def from_objects(cls, data_class, objects):
+        fields = schema_of(data_class).fields
+        values = {field: [] for field in fields}
+        for obj in objects:
+            for field in fields:
+                values[field].append(getattr(obj, field, None))
+        return cls(data_class, {field: _make_column(column) for field, column in values.items()})
+
+    @classmethod
+    def from_dicts(cls, data_class, records):
+        fields = schema_of(data_class).fields
+        values = {field: [] for field in fields}
+        for record in records:
+            for field in fields:
+                values[field].append(record.get(field))
+        return cls(data_class, {field: _make_column(column) for field, column in values.items()})
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(range(*index.indices(self._length)))
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('Frame index out of range')
+        row = {field: self._columns[field][index] for field in self.fields}
+        if numpy is not None:
+            row = {field: value.item() if isinstance(value, numpy.generic) else value for field, value in row.items()}
+        return self.data_class.from_dict(row)
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self[index]
+
+    def column(self, field):
+        return self._columns[field]
+
+    def take(self, indices):
+        indices = list(indices)
+        columns = {field: _take(column, indices) for field, column in self._columns.items()}
+        return DataObjectFrame(self.data_class, columns)
+
+    def where(self, field, value, op='=='):
+        column = self._columns[field]
+        if numpy is not None and isinstance(column, numpy.ndarray):
+            return self.take(numpy.flatnonzero(_OPERATORS[op](column, value)))
+        compare = _OPERATORS[op]
+        if op in _ORDERING:
+            return self.take(index for index, item in enumerate(column) if item is not None and compare(item, value))
+        return self.take(index for index, item in enumerate(column) if compare(item, value))
+
+    def to_records(self) -> list:
+        return list(zip(*(_to_list(self._columns[field]) for field in self.fields)))
+
+    def as_json(self) -> list:
+        return [dict(zip(self.fields, record)) for record in self.to_records()]
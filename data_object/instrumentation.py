@@ -0,0 +1,150 @@
+import json
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+
+OPERATIONS = {
+    'from_dict': 'from_dict',
+    'as_json': 'as_json',
+    'copy': 'copy',
+    '__eq__': 'eq',
+    '__hash__': 'hash',
+    '__str__': 'str',
+    '__repr__': 'repr',
+}
+
+_enabled = False
+_root = None
+_stats = {}
+_originals = {}
+_active = set()
+
+
+def _record(cls, operation, elapsed) -> None:
+    entry = _stats.get((cls, operation))
+    if entry is None:
+        _stats[(cls, operation)] = [1, elapsed]
+    else:
+        entry[0] += 1
+        entry[1] += elapsed
+
+
+def _wrap_method(method, operation):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (id(self), operation)
+        if key in _active:
+            return method(self, *args, **kwargs)
+        _active.add(key)
+        start = perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _record(self.__class__, operation, perf_counter() - start)
+            _active.discard(key)
+    wrapper.__instrumented__ = True
+    return wrapper
+
+
+def _wrap_classmethod(method, operation):
+    @wraps(method)
+    def wrapper(cls, *args, **kwargs):
+        key = (id(cls), operation)
+        if key in _active:
+            return method(cls, *args, **kwargs)
+        _active.add(key)
+        start = perf_counter()
+        try:
+            return method(cls, *args, **kwargs)
+        finally:
+            _record(cls, operation, perf_counter() - start)
+            _active.discard(key)
+    wrapper.__instrumented__ = True
+    return classmethod(wrapper)
+
+
+def instrument_class(cls) -> None:
+    if not _enabled:
+        return
+    for name, operation in OPERATIONS.items():
+        member = cls.__dict__.get(name)
+        if member is None:
+            continue
+        if isinstance(member, classmethod):
+            if getattr(member.__func__, '__instrumented__', False):
+                continue
+            wrapped = _wrap_classmethod(member.__func__, operation)
+        elif callable(member) and not getattr(member, '__instrumented__', False):
+            wrapped = _wrap_method(member, operation)
+        else:
+            continue
+        _originals[(cls, name)] = member
+        type.__setattr__(cls, name, wrapped)
+
+
+def _classes(root):
+    pending = [root]
+    while pending:
+        cls = pending.pop()
+        yield cls
+        pending.extend(cls.__subclasses__())
+
+
+def enable() -> None:
+    global _enabled, _root
+    if _enabled:
+        return
+    from data_object.data_object import DataObject
+    _enabled = True
+    _root = DataObject
+    for cls in _classes(_root):
+        instrument_class(cls)
+
+
+def disable() -> None:
+    global _enabled
+    if not _enabled:
+        return
+    _enabled = False
+    for (cls, name), original in _originals.items():
+        member = cls.__dict__.get(name)
+        function = member.__func__ if isinstance(member, classmethod) else member
+        if getattr(function, '__instrumented__', False):
+            type.__setattr__(cls, name, original)
+    _originals.clear()
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+@contextmanager
+def instrumented():
+    was_enabled = _enabled
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def reset() -> None:
+    _stats.clear()
+
+
+def snapshot() -> dict:
+    result = {}
+    for (cls, operation), (calls, elapsed) in list(_stats.items()):
+        name = '{0}.{1}'.format(cls.__module__, cls.__qualname__)
+        entry = result.setdefault(name, {}).setdefault(operation, {'calls': 0, 'time': 0.0})
+        entry['calls'] += calls
+        entry['time'] += elapsed
+    return result
+
+
+def export(fp=None):
+    data = json.dumps(snapshot(), indent=2, sort_keys=True)
+    if fp is None:
+        return data
+    fp.write(data)
@@ -0,0 +1,64 @@
+from weakref import WeakValueDictionary
+
+INTERN_ATTR = '_ImmutableDataObject__interned'
+DEFAULT_INTERN_LIMIT = 100000
+
+
+class InternTable:
+
+    def __init__(self, limit=DEFAULT_INTERN_LIMIT) -> None:
+        self.limit = limit
+        self.hits = 0
+        self.misses = 0
+        self._instances = WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def get(self, key):
+        instance = self._instances.get(key)
+        if instance is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return instance
+
+    def add(self, key, instance) -> None:
+        instances = self._instances
+        while len(instances) >= self.limit:
+            try:
+                del instances[next(iter(instances))]
+            except (KeyError, StopIteration, RuntimeError):
+                break
+        instances[key] = instance
+
+    def clear(self) -> None:
+        self._instances.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {'size': len(self._instances), 'limit': self.limit, 'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0}
+
+
+def intern_table_of(cls):
+    return cls.__dict__.get(INTERN_ATTR)
+
+
+def intern_key(schema, args, kwargs):
+    if len(args) > len(schema.args):
+        return None
+    values = dict(zip(schema.args, args))
+    for name, value in kwargs.items():
+        if name in values or name not in schema.defaults and name not in schema.required:
+            return None
+        values[name] = value
+    try:
+        key = tuple(values[arg] if arg in values else schema.defaults[arg] for arg in schema.args)
+        key += tuple(type(value) for value in key)
+        hash(key)
+    except (KeyError, TypeError):
+        return None
+    return key
@@ -0,0 +1,172 @@
+from collections.abc import Mapping
+from typing import Union, get_args, get_origin, get_type_hints
+
+try:
+    from types import UnionType
+except ImportError:
+    UnionType = Union
+
+from data_object.coercion import COERCION_ERRORS, LENIENT, compile_converter
+from data_object.exceptions import CoercionError, CyclicReferenceError, NestingTooDeepError
+from data_object.schema import SCHEMA_ATTR, schema_of
+
+DEFAULT_MAX_DEPTH = 100
+
+
+class LoadContext:
+
+    def __init__(self, none_if_not_found=False, max_depth=DEFAULT_MAX_DEPTH) -> None:
+        self.none_if_not_found = none_if_not_found
+        self.max_depth = max_depth
+        self.active = set()
+
+
+def is_data_object_class(tp) -> bool:
+    return isinstance(tp, type) and hasattr(tp, SCHEMA_ATTR)
+
+
+def field_types(cls) -> dict:
+    declared = getattr(cls, '__field_types__', None)
+    if declared is not None:
+        return dict(declared)
+    try:
+        hints = get_type_hints(cls.__init__)
+    except (NameError, TypeError):
+        hints = {name: hint for name, hint in getattr(cls.__init__, '__annotations__', {}).items() if
+                 not isinstance(hint, str)}
+    return {arg: hints[arg] for arg in schema_of(cls).args if arg in hints}
+
+
+def compile_loader(tp, coerce=False):
+    if is_data_object_class(tp):
+        def load_object_field(value, context, depth):
+            if isinstance(value, Mapping):
+                return load_object(tp, value, context, depth + 1)
+            return value
+        return load_object_field
+    origin, args = get_origin(tp), get_args(tp)
+    if origin is Union or origin is UnionType:
+        loaders = [compile_loader(arg, coerce) for arg in args if arg is not type(None)]
+        loaders = [loader for loader in loaders if loader is not None]
+        if len(loaders) == 1 or not coerce:
+            return loaders[0] if len(loaders) == 1 else None
+        return _union_loader(args, loaders) if loaders else None
+    if origin in (list, tuple, set, frozenset) and args:
+        item_loader = compile_loader(args[0], coerce)
+        if item_loader is None or (origin is tuple and not (len(args) == 2 and args[1] is Ellipsis)):
+            return None
+
+        def load_items(value, context, depth):
+            if isinstance(value, (list, tuple, set, frozenset)):
+                return origin(item_loader(item, context, depth) for item in value)
+            return value
+        return load_items
+    if origin is dict and len(args) == 2:
+        value_loader = compile_loader(args[1], coerce)
+        if value_loader is None:
+            return None
+
+        def load_values(value, context, depth):
+            if isinstance(value, Mapping):
+                return {key: value_loader(item, context, depth) for key, item in value.items()}
+            return value
+        return load_values
+    convert = compile_converter(tp) if coerce else None
+    if convert is not None:
+        def load_scalar(value, context, depth):
+            if value is None or type(value) is tp:
+                return value
+            return convert(value)
+        return load_scalar
+    return None
+
+
+def _union_loader(types, loaders):
+    exact = tuple(tp for tp in types if isinstance(tp, type))
+
+    def load_union(value, context, depth):
+        if type(value) in exact:
+            return value
+        error = None
+        for loader in loaders:
+            try:
+                return loader(value, context, depth)
+            except COERCION_ERRORS as err:
+                error = err
+        raise error
+    return load_union
+
+
+def loaders_of(schema) -> dict:
+    loaders = schema.loaders
+    if loaders is None:
+        loaders = {}
+        for field, tp in field_types(schema.cls).items():
+            loader = compile_loader(tp, schema.coerce is not None)
+            if loader is not None:
+                loaders[field] = loader
+        schema.loaders = loaders
+    return loaders
+
+
+def load_object(cls, params, context, depth=0):
+    if depth > context.max_depth:
+        raise NestingTooDeepError(context.max_depth)
+    key = id(params)
+    if key in context.active:
+        raise CyclicReferenceError('Cyclic reference found in {}'.format(cls.__name__))
+    context.active.add(key)
+    try:
+        schema = schema_of(cls)
+        try:
+            kwargs = {arg: params[arg] for arg in schema.args}
+        except KeyError:
+            kwargs = schema.constructor_kwargs(params, context.none_if_not_found)
+        if schema.coerce is None:
+            for field, loader in loaders_of(schema).items():
+                if field in kwargs:
+                    kwargs[field] = loader(kwargs[field], context, depth)
+        else:
+            _coerce_fields(schema, kwargs, context, depth)
+        # noinspection PyArgumentList
+        return cls(**kwargs)
+    finally:
+        context.active.discard(key)
+
+
+def _coerce_fields(schema, kwargs, context, depth) -> None:
+    errors = {}
+    for field, loader in loaders_of(schema).items():
+        if field in kwargs:
+            try:
+                kwargs[field] = loader(kwargs[field], context, depth)
+            except COERCION_ERRORS as err:
+                if schema.coerce != LENIENT:
+                    errors[field] = err
+    if errors:
+        raise CoercionError(schema.cls.__name__, errors)
+
+
+def dump_value(value, max_depth=DEFAULT_MAX_DEPTH, depth=0, active=None):
+    if active is None:
+        active = set()
+    if is_data_object_class(type(value)):
+        if depth > max_depth:
+            raise NestingTooDeepError(max_depth)
+        return _dump_container(value, value.as_json(), max_depth, depth + 1, active)
+    if isinstance(value, (list, tuple, set, frozenset, dict)):
+        return _dump_container(value, value, max_depth, depth, active)
+    return value
+
+
+def _dump_container(owner, value, max_depth, depth, active):
+    key = id(owner)
+    if key in active:
+        raise CyclicReferenceError('Cyclic reference found in {}'.format(type(owner).__name__))
+    active.add(key)
+    try:
+        if isinstance(value, dict):
+            return {name: dump_value(item, max_depth, depth, active) for name, item in value.items()}
+        return [dump_value(item, max_depth, depth, active) for item in value]
+    finally:
+        active.discard(key)
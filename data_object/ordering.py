@@ -0,0 +1,70 @@
+from heapq import merge
+from keyword import iskeyword
+from operator import methodcaller
+
+from data_object.cache import compile_source
+from data_object.properties import FROZEN_ATTR, cached_value
+
+ORDER_ATTR = '_DataObject__order'
+SORT_KEY_CACHE = '__sort_key__'
+
+_TEMPLATE = '''
+def _sort_key(self):
+    return ({values})
+
+
+def __lt__(self, other):
+    if not isinstance(other, _owner):
+        return NotImplemented
+    return self.sort_key() < other.sort_key()
+
+
+def __le__(self, other):
+    if not isinstance(other, _owner):
+        return NotImplemented
+    return self.sort_key() <= other.sort_key()
+
+
+def __gt__(self, other):
+    if not isinstance(other, _owner):
+        return NotImplemented
+    return self.sort_key() > other.sort_key()
+
+
+def __ge__(self, other):
+    if not isinstance(other, _owner):
+        return NotImplemented
+    return self.sort_key() >= other.sort_key()
+'''
+
+
+def order_fields(order) -> tuple:
+    fields = (order,) if isinstance(order, str) else tuple(order)
+    invalid = [field for field in fields if not field.isidentifier() or iskeyword(field)]
+    if not fields or invalid:
+        raise ValueError('Invalid order fields: {0}'.format(', '.join(invalid) or 'empty'))
+    return fields
+
+
+def install_ordering(cls, fields) -> None:
+    namespace = {'_owner': cls}
+    source = _TEMPLATE.format(values=''.join('self.{0}, '.format(field) for field in fields))
+    exec(compile_source(source, '<ordering {0}>'.format(cls.__qualname__)), namespace)
+    compute = namespace.pop('_sort_key')
+    if hasattr(cls, FROZEN_ATTR):
+        def sort_key(self):
+            return cached_value(self, SORT_KEY_CACHE, compute)
+    else:
+        sort_key = compute
+    methods = {'sort_key': sort_key, **{name: namespace[name] for name in ('__lt__', '__le__', '__gt__', '__ge__')}}
+    type.__setattr__(cls, ORDER_ATTR, fields)
+    for name, method in methods.items():
+        if name in cls.__dict__:
+            continue
+        method.__name__ = name
+        method.__qualname__ = '{0}.{1}'.format(cls.__qualname__, name)
+        type.__setattr__(cls, name, method)
+
+
+def merge_sorted(*streams, key=None, reverse=False):
+    return merge(*streams, key=methodcaller('sort_key') if key is None else key, reverse=reverse)
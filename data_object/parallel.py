@@ -0,0 +1,118 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import chain, islice
+from os import cpu_count
+
+from data_object.interning import intern_table_of
+from data_object.nested import DEFAULT_MAX_DEPTH
+from data_object.schema import schema_of
+
+DEFAULT_CHUNK_SIZE = 5000
+DEFAULT_MIN_PARALLEL = 20000
+
+
+def _pack(cls, objects):
+    schema = schema_of(cls)
+    if not schema.plain_init or any(obj.__class__ is not cls for obj in objects):
+        return False, objects
+    args = schema.args
+    return True, [tuple(getattr(obj, arg) for arg in args) for obj in objects]
+
+
+def _unpack(cls, payload) -> list:
+    compact, items = payload
+    if not compact:
+        return items
+    schema = schema_of(cls)
+    args = schema.args
+    if not schema.plain_init or not schema.dict_state or intern_table_of(cls) is not None:
+        restore = cls._from_values
+        return [restore(dict(zip(args, values))) for values in items]
+    new = cls.__new__
+    finish = cls._finish_construction
+    instances = []
+    for values in items:
+        instance = new(cls)
+        instance.__dict__.update(zip(args, values))
+        finish(instance)
+        instances.append(instance)
+    return instances
+
+
+def _convert_dicts(cls, records, none_if_not_found, max_depth):
+    return _pack(cls, cls.from_dicts(records, none_if_not_found, max_depth=max_depth))
+
+
+def _convert_objects(cls, payload, max_depth) -> list:
+    return [obj.as_json(recursive=True, max_depth=max_depth) for obj in _unpack(cls, payload)]
+
+
+def _chunks(iterator, size):
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _run(function, chunks, processes, ordered, executor):
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(processes)
+    limit = 2 * (processes or cpu_count() or 1)
+    pending = deque() if ordered else set()
+    try:
+        for chunk in chunks:
+            if len(pending) >= limit:
+                yield from _collect(pending, ordered)
+            future = executor.submit(function, *chunk)
+            pending.append(future) if ordered else pending.add(future)
+        while pending:
+            yield from _collect(pending, ordered)
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown()
+
+
+def _collect(pending, ordered):
+    if ordered:
+        yield pending.popleft().result()
+        return
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        pending.discard(future)
+        yield future.result()
+
+
+def _split(items, min_parallel):
+    iterator = iter(items)
+    head = list(islice(iterator, min_parallel))
+    if len(head) < min_parallel:
+        return head, None
+    return head, chain(head, iterator)
+
+
+def parallel_from_dicts(cls, records, processes=None, chunk_size=DEFAULT_CHUNK_SIZE, ordered=True,
+                        min_parallel=DEFAULT_MIN_PARALLEL, none_if_not_found=False, max_depth=DEFAULT_MAX_DEPTH,
+                        executor=None):
+    head, iterator = _split(records, min_parallel)
+    if iterator is None or processes == 1:
+        yield from cls.iter_from_dicts(head if iterator is None else iterator, none_if_not_found, max_depth=max_depth)
+        return
+    chunks = ((cls, chunk, none_if_not_found, max_depth) for chunk in _chunks(iterator, chunk_size))
+    for payload in _run(_convert_dicts, chunks, processes, ordered, executor):
+        yield from _unpack(cls, payload)
+
+
+def parallel_as_json(cls, objects, processes=None, chunk_size=DEFAULT_CHUNK_SIZE, ordered=True,
+                     min_parallel=DEFAULT_MIN_PARALLEL, max_depth=DEFAULT_MAX_DEPTH, executor=None):
+    head, iterator = _split(objects, min_parallel)
+    if iterator is None or processes == 1:
+        for obj in head if iterator is None else iterator:
+            yield obj.as_json(recursive=True, max_depth=max_depth)
+        return
+    chunks = ((cls, _pack(cls, chunk), max_depth) for chunk in _chunks(iterator, chunk_size))
+    for values in _run(_convert_objects, chunks, processes, ordered, executor):
+        yield from values
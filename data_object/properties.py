@@ -0,0 +1,36 @@
+FROZEN_ATTR = '_ImmutableDataObject__frozen'
+CACHE_ATTR = '_ImmutableDataObject__cache'
+HASH_ATTR = '_ImmutableDataObject__hash'
+JSON_ATTR = '_ImmutableDataObject__json'
+REPR_ATTR = '_ImmutableDataObject__repr'
+STATE_ATTRS = frozenset((FROZEN_ATTR, CACHE_ATTR, HASH_ATTR, JSON_ATTR, REPR_ATTR))
+
+
+class cached_property:
+
+    def __init__(self, func) -> None:
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name) -> None:
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return cached_value(instance, self.name, self.func)
+
+
+def cached_value(instance, name, compute):
+    cache = getattr(instance, CACHE_ATTR, None)
+    if cache is None:
+        if not getattr(instance, FROZEN_ATTR, False):
+            return compute(instance)
+        cache = {}
+        object.__setattr__(instance, CACHE_ATTR, cache)
+    try:
+        return cache[name]
+    except KeyError:
+        value = cache[name] = compute(instance)
+        return value
@@ -0,0 +1,43 @@
+from data_object.cache import compile_source
+from data_object.exceptions import ConstructorKeywordArgumentNotFound
+from data_object.nested import LoadContext, load_object, loaders_of
+from data_object.schema import schema_of
+
+DEFAULT_FETCH_SIZE = 1000
+
+
+def column_names(columns) -> tuple:
+    return tuple(column if isinstance(column, str) else column[0] for column in columns)
+
+
+def compile_row_loader(cls, columns, none_if_not_found=False, context=None):
+    names = column_names(columns)
+    positions = {}
+    for index, name in enumerate(names):
+        positions.setdefault(name, index)
+    schema = schema_of(cls)
+    if loaders_of(schema):
+        context = context or LoadContext(none_if_not_found)
+        return lambda row: load_object(cls, dict(zip(names, row)), context)
+    arguments = []
+    for arg in schema.args:
+        if arg in positions:
+            arguments.append('{0}=row[{1}]'.format(arg, positions[arg]))
+        elif arg in schema.defaults:
+            continue
+        elif none_if_not_found:
+            arguments.append('{0}=None'.format(arg))
+        else:
+            raise ConstructorKeywordArgumentNotFound(KeyError(arg))
+    source = 'def load(row):\n    return cls({0})\n'.format(', '.join(arguments))
+    namespace = {}
+    exec(compile_source(source, '<row loader {0}>'.format(cls.__qualname__)), {'cls': cls}, namespace)
+    return namespace['load']
+
+
+def iter_cursor_rows(cursor, fetch_size=DEFAULT_FETCH_SIZE):
+    while True:
+        rows = cursor.fetchmany(fetch_size)
+        if not rows:
+            return
+        yield from rows
@@ -0,0 +1,175 @@
+from dis import get_instructions
+from inspect import getfullargspec
+from types import FunctionType, MemberDescriptorType, MethodType
+
+from data_object.cache import cached_fact, code_key
+from data_object.exceptions import ConstructorKeywordArgumentNotFound
+
+SCHEMA_ATTR = '_DataObject__schema'
+PROPERTIES_ATTR = '_DataObject__properties'
+COMPARED_ATTR = '_DataObject__compared_properties'
+COERCE_ATTR = '_DataObject__coerce'
+
+_NONE = object()
+_IGNORED_OPCODES = frozenset(('RESUME', 'NOP', 'CACHE', 'EXTENDED_ARG'))
+
+
+class ClassSchema:
+
+    def __init__(self, cls) -> None:
+        self.cls = cls
+        spec = getfullargspec(cls.__init__)
+        defaults = spec.defaults or ()
+        with_defaults = spec.args[len(spec.args) - len(defaults):]
+        self.args = tuple(spec.args[1:])
+        self.defaults = {arg: value for arg, value in zip(with_defaults, defaults) if arg in self.args}
+        self.required = frozenset(arg for arg in self.args if arg not in self.defaults)
+        self.fields = tuple(getattr(cls, '__fields__', self.args))
+        self.coerce = getattr(cls, COERCE_ATTR, None)
+        self.loaders = None
+        self.binary = None
+        self._resolve_members(cls)
+        self.plain_init = (_cached_plain_init(cls.__init__, self.args) and _bypassable(cls) and
+                           not self.data_descriptors.union(self.class_properties, self.hidden_properties)
+                           .intersection(self.args))
+        self.dict_state = self.instance_dict and not self.all_slots.intersection(self.args)
+
+    def _resolve_members(self, cls) -> None:
+        selected = getattr(cls, PROPERTIES_ATTR, None)
+        state_names = frozenset(self.args).union(self.fields)
+        class_values = {}
+        class_properties = set()
+        hidden_properties = set()
+        for key, value in cls.__dict__.items():
+            if key.startswith('_') or isinstance(value, (FunctionType, classmethod, MemberDescriptorType)):
+                continue
+            if hasattr(type(value), '__get__'):
+                if selected is not None and key not in selected and key not in state_names:
+                    hidden_properties.add(key)
+                    continue
+                class_properties.add(key)
+                class_values[key] = None
+            elif not isinstance(value, MethodType):
+                class_values[key] = value
+        resolved = {}
+        for klass in reversed(cls.__mro__):
+            resolved.update(klass.__dict__)
+        self.class_values = class_values
+        self.class_properties = frozenset(class_properties)
+        self.hidden_properties = frozenset(hidden_properties)
+        compared = getattr(cls, COMPARED_ATTR, ())
+        self.compared_properties = self.class_properties if compared is None else \
+            self.class_properties.intersection(state_names.union(compared))
+        self.compared_fields = tuple(key for key in dict.fromkeys((*self.fields, *class_values)) if
+                                     key not in class_properties or key in self.compared_properties)
+        self.slots = tuple(key for key, value in resolved.items() if
+                           not key.startswith('_') and isinstance(value, MemberDescriptorType))
+        self.all_slots = frozenset(key for key, value in resolved.items() if isinstance(value, MemberDescriptorType))
+        self.data_descriptors = frozenset(key for key, value in resolved.items() if
+                                          not key.startswith('_') and key not in class_properties and
+                                          key not in self.hidden_properties and
+                                          key not in self.slots and
+                                          (hasattr(type(value), '__set__') or hasattr(type(value), '__delete__')))
+        self.instance_dict = any('__dict__' in klass.__dict__ for klass in cls.__mro__)
+
+    def constructor_kwargs(self, params, none_if_not_found=False) -> dict:
+        kwargs = {}
+        for arg in self.args:
+            try:
+                kwargs[arg] = params[arg]
+            except KeyError as err:
+                if arg in self.defaults:
+                    continue
+                elif none_if_not_found:
+                    kwargs[arg] = None
+                else:
+                    raise ConstructorKeywordArgumentNotFound(err)
+        return kwargs
+
+
+def _cached_plain_init(init, args) -> bool:
+    code = getattr(init, '__code__', None)
+    if code is None:
+        return False
+    return cached_fact('plain_init', code_key(code, args), lambda: is_plain_init(init, args))
+
+
+def _bypassable(cls) -> bool:
+    return ((cls.__new__ is object.__new__ or getattr(cls.__new__, '__bypassable__', False)) and
+            (cls.__setattr__ is object.__setattr__ or getattr(cls.__setattr__, '__bypassable__', False)))
+
+
+# Heuristic: accepts only bytecode made of `self.<arg> = <arg>` statements, so it may reject constructors that are
+# plain in effect, but never accepts one with other side effects.
+def is_plain_init(init, args) -> bool:
+    code = getattr(init, '__code__', None)
+    if code is None or code.co_argcount != len(args) + 1 or code.co_kwonlyargcount or code.co_flags & 0x0c:
+        return False
+    owner_name = code.co_varnames[0]
+    stack = []
+    stored = set()
+    for instruction in get_instructions(code):
+        opname = instruction.opname
+        if opname in _IGNORED_OPCODES:
+            continue
+        if opname.startswith('LOAD_FAST'):
+            names = instruction.argval
+            stack.extend(names if isinstance(names, tuple) else (names,))
+        elif opname == 'STORE_ATTR':
+            if len(stack) < 2 or stack.pop() != owner_name or stack.pop() != instruction.argval:
+                return False
+            stored.add(instruction.argval)
+        elif opname == 'LOAD_CONST' and instruction.argval is None:
+            stack.append(_NONE)
+        elif (opname == 'RETURN_VALUE' and stack == [_NONE] or
+              opname == 'RETURN_CONST' and instruction.argval is None and not stack):
+            return stored == set(args)
+        else:
+            return False
+    return False
+
+
+def derive_slots(bases, namespace, extra=()) -> tuple:
+    if '__fields__' in namespace:
+        fields = namespace['__fields__']
+    elif '__init__' in namespace:
+        fields = getfullargspec(namespace['__init__']).args[1:]
+    else:
+        fields = getattr(bases[0], '__fields__', None) or getfullargspec(bases[0].__init__).args[1:]
+    existing = set()
+    for base in bases:
+        for klass in base.__mro__:
+            slots = klass.__dict__.get('__slots__', ())
+            existing.update((slots,) if isinstance(slots, str) else slots)
+    return tuple(field for field in (*fields, *extra) if field not in existing and field not in namespace)
+
+
+def schema_of(cls) -> ClassSchema:
+    schema = getattr(cls, SCHEMA_ATTR, None)
+    if schema is None or schema.cls is not cls:
+        schema = ClassSchema(cls)
+        type.__setattr__(cls, SCHEMA_ATTR, schema)
+    return schema
+
+
+def update_class_value(cls, name, value) -> bool:
+    schema = cls.__dict__.get(SCHEMA_ATTR)
+    if schema is None or name not in schema.class_values or name in schema.class_properties:
+        return False
+    if isinstance(value, (FunctionType, classmethod, MemberDescriptorType, MethodType)) or \
+            hasattr(type(value), '__get__'):
+        return False
+    schema.class_values[name] = value
+    return True
+
+
+def invalidate_schema(cls) -> list:
+    affected = []
+    pending = [cls]
+    while pending:
+        klass = pending.pop()
+        if klass.__dict__.get(SCHEMA_ATTR) is not None:
+            type.__setattr__(klass, SCHEMA_ATTR, None)
+        affected.append(klass)
+        pending.extend(klass.__subclasses__())
+    return affected
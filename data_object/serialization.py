@@ -0,0 +1,76 @@
+import io
+import json
+from datetime import date, datetime, time
+from enum import Enum
+
+from data_object.exceptions import RecordConversionError
+from data_object.nested import is_data_object_class
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def default_encoder(value):
+    if is_data_object_class(type(value)):
+        return value.as_json(recursive=True)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError('Object of type {0} is not JSON serializable'.format(type(value).__name__))
+
+
+def _encoder(default=None) -> json.JSONEncoder:
+    if default is None:
+        return _DEFAULT_ENCODER
+    return json.JSONEncoder(default=default, separators=(',', ':'), ensure_ascii=False)
+
+
+_DEFAULT_ENCODER = json.JSONEncoder(default=default_encoder, separators=(',', ':'), ensure_ascii=False)
+
+
+def to_json(obj, as_bytes=False, default=None):
+    encoded = _encoder(default).encode(obj)
+    return encoded.encode('utf-8') if as_bytes else encoded
+
+
+def dump_ndjson(objects, fp, chunk_size=DEFAULT_CHUNK_SIZE, default=None) -> int:
+    encode = _encoder(default).encode
+    binary = not isinstance(fp, io.TextIOBase)
+    count = 0
+    lines = []
+    for obj in objects:
+        lines.append(encode(obj))
+        count += 1
+        if len(lines) >= chunk_size:
+            _write_lines(fp, lines, binary)
+            lines = []
+    if lines:
+        _write_lines(fp, lines, binary)
+    return count
+
+
+def _write_lines(fp, lines, binary) -> None:
+    chunk = '\n'.join(lines) + '\n'
+    fp.write(chunk.encode('utf-8') if binary else chunk)
+
+
+def load_ndjson(fp, cls, none_if_not_found=False, errors=None):
+    if errors is None:
+        return cls.iter_from_dicts((json.loads(line) for line in fp if line.strip()), none_if_not_found)
+    failed = []
+    return cls.iter_from_dicts(_decode_lines(fp, failed, errors), none_if_not_found, failed)
+
+
+def _decode_lines(fp, failed, errors):
+    for index, line in enumerate(fp):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as err:
+            errors.append(RecordConversionError(index, line, err))
+            continue
+        yield record
+        if failed:
+            errors.extend(RecordConversionError(index, error.record, error.cause) for error in failed)
+            failed.clear()
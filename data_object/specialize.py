@@ -0,0 +1,149 @@
+from keyword import iskeyword
+
+from data_object.cache import compile_source
+from data_object.instrumentation import instrument_class
+from data_object.properties import STATE_ATTRS
+from data_object.schema import schema_of
+
+SPECIALIZED_ATTR = '_DataObject__specialized'
+
+_TEMPLATE = '''
+def __eq__(self, other):
+    if self is other:
+        return True
+    if other.__class__ is not self.__class__:
+        return False
+{guard_eq}    try:
+{compare}
+    except AttributeError:
+        return _generic.__eq__(self, other)
+    return True
+
+
+def __hash__(self):
+{guard_hash}    try:
+        return hash(({values}))
+    except (AttributeError, TypeError):
+        return _generic.__hash__(self)
+
+
+def __repr__(self):
+{guard_repr}    try:
+        return f'{{self.__class__.__name__}}({repr_pairs})'
+    except AttributeError:
+        return _generic.__repr__(self)
+
+
+def __str__(self):
+{guard_str}    try:
+        return f'{{self.__class__.__name__}}: {{{{{str_pairs}}}}}'
+    except AttributeError:
+        return _generic.__str__(self)
+'''
+
+_FALLBACK = '''
+def __eq__(self, other):
+    return _generic.__eq__(self, other)
+
+
+def __hash__(self):
+    return _generic.__hash__(self)
+
+
+def __repr__(self):
+    return _generic.__repr__(self)
+
+
+def __str__(self):
+    return _generic.__str__(self)
+'''
+
+_GUARD = '''    if {0}:
+        return _generic.{1}({2})
+'''
+
+_COMPARE = '''        left, right = self.{0}, other.{0}
+        if left is not right and not left == right:
+            return False'''
+
+
+def _keep_existing(cls, name) -> bool:
+    for klass in cls.__mro__:
+        method = klass.__dict__.get(name)
+        if method is None or getattr(method, '__specialized__', False):
+            continue
+        return getattr(method, '__cached__', False) or klass.__dict__.get(SPECIALIZED_ATTR, False)
+    return False
+
+
+def specialized_fields(cls):
+    schema = schema_of(cls)
+    fields = sorted(set(schema.fields) | set(schema.class_values))
+    if all(field.isidentifier() and not iskeyword(field) for field in fields):
+        return fields
+    return None
+
+
+def _extra_state_check(cls):
+    schema = schema_of(cls)
+    if not schema.instance_dict:
+        return None
+    known = STATE_ATTRS.union(schema.fields, schema.class_values, schema.class_properties, schema.hidden_properties)
+
+    def has_extra_state(instance):
+        state = instance.__dict__
+        return not known.issuperset(state) and any(key[0] != '_' and key not in known for key in state)
+    return has_extra_state
+
+
+def _guard(has_extra, condition, method, arguments) -> str:
+    return '' if has_extra is None else _GUARD.format(condition, method, arguments)
+
+
+def specialize(cls, generic) -> None:
+    fields = specialized_fields(cls)
+    has_extra = None
+    if fields is None:
+        source = _FALLBACK
+    else:
+        has_extra = _extra_state_check(cls)
+        compared = sorted(schema_of(cls).compared_fields)
+        source = _TEMPLATE.format(
+            guard_eq=_guard(has_extra, '_extra(self) or _extra(other)', '__eq__', 'self, other'),
+            guard_hash=_guard(has_extra, '_extra(self)', '__hash__', 'self'),
+            guard_repr=_guard(has_extra, '_extra(self)', '__repr__', 'self'),
+            guard_str=_guard(has_extra, '_extra(self)', '__str__', 'self'),
+            compare='\n'.join(_COMPARE.format(field) for field in compared) or '        pass',
+            values=''.join('self.{0}, '.format(field) for field in compared),
+            repr_pairs=', '.join('{0}={{self.{0}}}'.format(field) for field in fields),
+            str_pairs=', '.join('"{0}": {{self.{0}}}'.format(field) for field in fields))
+    methods = {}
+    namespace = {'_generic': generic, '_extra': has_extra}
+    exec(compile_source(source, '<specialized {0}>'.format(cls.__qualname__)), namespace, methods)
+    for name, method in methods.items():
+        if _keep_existing(cls, name):
+            continue
+        method.__qualname__ = '{0}.{1}'.format(cls.__qualname__, name)
+        method.__specialized__ = True
+        type.__setattr__(cls, name, method)
+
+
+def _lazy_method(cls, generic, name):
+    def method(self, *args):
+        current = cls.__dict__.get(name)
+        if current is method or getattr(current, '__wrapped__', None) is method:
+            specialize(cls, generic)
+            instrument_class(cls)
+        return cls.__dict__[name](self, *args)
+    return method
+
+
+def specialize_lazily(cls, generic) -> None:
+    for name in ('__eq__', '__hash__', '__repr__', '__str__'):
+        if _keep_existing(cls, name):
+            continue
+        method = _lazy_method(cls, generic, name)
+        method.__name__ = name
+        method.__qualname__ = '{0}.{1}'.format(cls.__qualname__, name)
+        method.__specialized__ = True
+        type.__setattr__(cls, name, method)
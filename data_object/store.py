@@ -0,0 +1,116 @@
+import mmap
+import os
+from struct import Struct
+
+from data_object.binary import LENGTH_PREFIX, binary_schema_of
+from data_object.exceptions import StoreError
+from data_object.views import view_class_of
+
+MAGIC = b'DOS1'
+HEADER = Struct('<4sI')
+OFFSET = Struct('<Q')
+
+
+class DataObjectStore:
+
+    def __init__(self, path, data_class) -> None:
+        self.path = os.fspath(path)
+        self.data_class = data_class
+        self._binary = binary_schema_of(data_class)
+        self._data = open(self.path, 'a+b')
+        self._index = None
+        try:
+            self._index = open(self.path + '.idx', 'a+b')
+            self._size = os.fstat(self._data.fileno()).st_size
+            if self._size == 0:
+                self._data.write(HEADER.pack(MAGIC, self._binary.fingerprint))
+                self._size = HEADER.size
+            else:
+                self._check_header()
+            self._count = os.fstat(self._index.fileno()).st_size // OFFSET.size
+        except BaseException:
+            self._data.close()
+            if self._index is not None:
+                self._index.close()
+            raise
+        self._data_map = None
+        self._index_map = None
+        self._dirty = True
+
+    def _check_header(self) -> None:
+        self._data.seek(0)
+        magic, fingerprint = HEADER.unpack(self._data.read(HEADER.size))
+        if magic != MAGIC:
+            raise StoreError('{0} is not a data object store'.format(self.path))
+        if fingerprint != self._binary.fingerprint:
+            raise StoreError('{0} was written with different schema of {1}'.format(self.path,
+                                                                                     self.data_class.__name__))
+
+    def append(self, obj) -> int:
+        record = self._binary.pack(obj)
+        self._data.write(LENGTH_PREFIX.pack(len(record)))
+        self._data.write(record)
+        self._index.write(OFFSET.pack(self._size))
+        self._size += LENGTH_PREFIX.size + len(record)
+        self._count += 1
+        self._dirty = True
+        return self._count - 1
+
+    def extend(self, objects) -> None:
+        for obj in objects:
+            self.append(obj)
+
+    def flush(self) -> None:
+        self._data.flush()
+        self._index.flush()
+
+    def _maps(self):
+        if self._dirty:
+            self.flush()
+            if self._count:
+                self._data_map = mmap.mmap(self._data.fileno(), 0, access=mmap.ACCESS_READ)
+                self._index_map = mmap.mmap(self._index.fileno(), 0, access=mmap.ACCESS_READ)
+            self._dirty = False
+        return self._data_map, self._index_map
+
+    def _record_offset(self, index) -> int:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('Store index out of range')
+        data_map, index_map = self._maps()
+        return OFFSET.unpack_from(index_map, index * OFFSET.size)[0] + LENGTH_PREFIX.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        offset = self._record_offset(index)
+        return self._binary.unpack(self._data_map, offset)
+
+    def view(self, index):
+        offset = self._record_offset(index)
+        return view_class_of(self.data_class)(self._data_map, offset)
+
+    def __iter__(self):
+        count = self._count
+        data_map, _ = self._maps()
+        position = HEADER.size
+        for _ in range(count):
+            length, = LENGTH_PREFIX.unpack_from(data_map, position)
+            position += LENGTH_PREFIX.size
+            yield self._binary.unpack(data_map, position)
+            position += length
+
+    def close(self) -> None:
+        self.flush()
+        self._data.close()
+        self._index.close()
+        self._data_map = None
+        self._index_map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
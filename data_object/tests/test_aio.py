@@ -0,0 +1,121 @@
+import asyncio
+import io
+import json
+from unittest import IsolatedAsyncioTestCase
+
+from data_object import ImmutableDataObject
+from data_object.aio import abatches_from_dicts, adump_ndjson, aiter_from_dicts, buffered
+from data_object.exceptions import RecordConversionError
+
+
+class Event(ImmutableDataObject):
+    def __init__(self, number, kind='info'):
+        self.number = number
+        self.kind = kind
+
+
+async def records(count, log=None):
+    for index in range(count):
+        if log is not None:
+            log.append(index)
+        yield {'number': index}
+        await asyncio.sleep(0)
+
+
+class AsyncWriter:
+
+    def __init__(self) -> None:
+        self.chunks = []
+
+    async def write(self, data):
+        self.chunks.append(data)
+
+
+class TestAio(IsolatedAsyncioTestCase):
+
+    async def test_should_convert_async_stream_of_dicts(self):
+        # when
+        result = [instance async for instance in aiter_from_dicts(Event, records(5), batch_size=2)]
+
+        # then
+        self.assertEqual([Event(index) for index in range(5)], result)
+
+    async def test_should_yield_batches_and_collect_errors(self):
+        # given
+        errors = []
+        source = [{'number': 1}, {'kind': 'x'}, {'number': 3}, {'other': 4}, {'number': 5}]
+
+        # when
+        batches = [batch async for batch in abatches_from_dicts(Event, source, batch_size=2, errors=errors)]
+
+        # then
+        self.assertEqual([[Event(1)], [Event(3)], [Event(5)]], batches)
+        self.assertEqual([1, 3], [error.index for error in errors])
+        self.assertTrue(all(isinstance(error, RecordConversionError) for error in errors))
+
+    async def test_should_let_other_tasks_run_between_batches(self):
+        # given
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(len(ticks))
+                await asyncio.sleep(0)
+
+        task = asyncio.ensure_future(ticker())
+
+        # when
+        result = [instance async for instance in aiter_from_dicts(Event, [{'number': 1}] * 10, batch_size=2)]
+        task.cancel()
+
+        # then
+        self.assertEqual(10, len(result))
+        self.assertGreaterEqual(len(ticks), 4)
+
+    async def test_should_bound_read_ahead_with_buffer(self):
+        # given
+        log = []
+        consumed = []
+
+        # when
+        async for item in buffered(records(20, log), 3):
+            consumed.append(item)
+            await asyncio.sleep(0)
+            self.assertLessEqual(len(log) - len(consumed), 5)
+
+        # then
+        self.assertEqual(20, len(consumed))
+
+    async def test_should_propagate_errors_of_buffered_source(self):
+        # given
+        async def failing():
+            yield {'number': 1}
+            raise ValueError('broken')
+
+        # then
+        with self.assertRaises(ValueError):
+            [instance async for instance in aiter_from_dicts(Event, failing(), buffer_size=2)]
+
+    async def test_should_write_ndjson_to_async_writer(self):
+        # given
+        writer = AsyncWriter()
+        objects = aiter_from_dicts(Event, records(3))
+
+        # when
+        count = await adump_ndjson(objects, writer, chunk_size=2)
+
+        # then
+        self.assertEqual(3, count)
+        self.assertEqual(2, len(writer.chunks))
+        self.assertEqual([{'number': index, 'kind': 'info'} for index in range(3)],
+                         [json.loads(line) for line in ''.join(writer.chunks).splitlines()])
+
+    async def test_should_write_bytes_to_binary_writer(self):
+        # given
+        output = io.BytesIO()
+
+        # when
+        await adump_ndjson([Event(1)], output, binary=True)
+
+        # then
+        self.assertEqual(b'{"number":1,"kind":"info"}\n', output.getvalue())
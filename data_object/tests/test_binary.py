@@ -0,0 +1,123 @@
+import copy
+import pickle
+from typing import Optional
+from unittest import TestCase
+
+from data_object import DataObject, ImmutableDataObject
+from data_object.exceptions import BinarySchemaError
+
+
+class Leaf(ImmutableDataObject, compact_pickle=True):
+    def __init__(self, name: str, weight: float):
+        self.name = name
+        self.weight = weight
+
+
+class Record(DataObject):
+    def __init__(self, number: int, label: Optional[str], payload: bytes, flag: bool, leaf: Optional[Leaf] = None):
+        self.number = number
+        self.label = label
+        self.payload = payload
+        self.flag = flag
+        self.leaf = leaf
+
+
+class ChildLeaf(Leaf, compact_pickle=False):
+    pass
+
+
+class TestBinarySerialization(TestCase):
+
+    def test_should_convert_object_to_bytes_and_back(self):
+        # given
+        instance = Record(-5, 'zażółć', b'\x00\x01', True, Leaf('a', 1.5))
+
+        # when
+        data = instance.to_bytes()
+        result = Record.from_bytes(data)
+
+        # then
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(instance, result)
+        self.assertIsInstance(result.leaf, Leaf)
+
+    def test_should_convert_none_values(self):
+        # given
+        instance = Record(None, None, b'', False)
+
+        # when
+        result = Record.from_bytes(instance.to_bytes())
+
+        # then
+        self.assertIsNone(result.number)
+        self.assertIsNone(result.label)
+        self.assertIsNone(result.leaf)
+        self.assertEqual(b'', result.payload)
+
+    def test_should_be_smaller_than_pickle(self):
+        # given
+        instance = Record(1, 'abc', b'xyz', True)
+
+        # when
+        data = instance.to_bytes()
+
+        # then
+        self.assertLess(len(data), len(pickle.dumps(instance)) / 4)
+
+    def test_should_convert_many_objects_to_single_buffer(self):
+        # given
+        instances = [Record(number, str(number), b'', number % 2 == 0) for number in range(10)]
+
+        # when
+        data = Record.to_bytes_many(instances)
+        result = Record.from_bytes_many(data)
+
+        # then
+        self.assertEqual(instances, result)
+        self.assertEqual([], Record.from_bytes_many(b''))
+
+    def test_should_raise_exception_for_field_without_supported_type(self):
+        # given
+        class SimpleClass(DataObject):
+            def __init__(self, foo: int, bar):
+                self.foo = foo
+                self.bar = bar
+
+        # when
+        with self.assertRaisesRegex(BinarySchemaError, 'Field bar of SimpleClass has no binary representation'):
+            SimpleClass(1, 2).to_bytes()
+
+    def test_should_raise_exception_for_value_not_matching_field_type(self):
+        cases = ((Record(2 ** 70, 'a', b'', True), 'Value 1180591620717411303424 of field number of Record'),
+                 (Record('1', 'a', b'', True), "Value '1' of field number of Record cannot be packed as int"),
+                 (Record(1, 2, b'', True), 'Value 2 of field label of Record cannot be packed as str'))
+        for record, message in cases:
+            # when
+            with self.assertRaisesRegex(BinarySchemaError, message):
+                record.to_bytes()
+
+    def test_should_pickle_and_copy_with_compact_form(self):
+        # given
+        instance = Leaf('abc', 2.5)
+
+        # when
+        data = pickle.dumps(instance)
+        result = pickle.loads(data)
+        copied = copy.deepcopy(instance)
+
+        # then
+        self.assertEqual(instance, result)
+        self.assertEqual(instance, copied)
+        self.assertIn(instance.to_bytes(), data)
+        self.assertNotIn(b'weight', data)
+
+    def test_should_disable_compact_pickle_in_child_class(self):
+        # given
+        instance = ChildLeaf('abc', 2.5)
+
+        # when
+        data = pickle.dumps(instance)
+
+        # then
+        self.assertIn(b'weight', data)
+        self.assertEqual(instance, pickle.loads(data))
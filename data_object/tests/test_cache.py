@@ -0,0 +1,107 @@
+import marshal
+import os
+import pickle
+import tempfile
+from unittest import TestCase
+
+from data_object import DataObject, cache
+
+
+def define_class(name='Cached'):
+    class SomeClass(DataObject, specialized=True, order='a'):
+        def __init__(self, a, b=None):
+            self.a = a
+            self.b = b
+
+    SomeClass.__name__ = SomeClass.__qualname__ = name
+    return SomeClass
+
+
+class TestSchemaCache(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'schema.cache')
+
+    def tearDown(self):
+        cache.configure(None)
+        self.directory.cleanup()
+
+    def test_should_reuse_generated_code_and_schema_facts_from_disk(self):
+        # given
+        cache.configure(self.path, save_at_exit=False)
+        define_class().from_dict({'a': 1})
+        cache.save()
+
+        # when
+        loaded = cache.configure(self.path, save_at_exit=False)
+        cls = define_class()
+        instance = cls.from_dict({'a': 1})
+
+        # then
+        self.assertTrue(os.path.exists(self.path))
+        self.assertEqual(0, loaded.stats()['misses'])
+        self.assertGreater(loaded.stats()['hits'], 0)
+        self.assertEqual(cls(1), instance)
+        self.assertTrue(cls(1) < cls(2))
+        self.assertTrue(getattr(cls.__eq__, '__specialized__', False))
+
+    def test_should_ignore_invalid_cache_file(self):
+        contents = (b'broken', marshal.dumps({'format': (b'DOC1', b'old'), 'code': {'x': b''}, 'facts': {}}),
+                    pickle.dumps({'code': {'x': b''}}))
+        for index, content in enumerate(contents):
+            # given
+            path = '{0}.{1}'.format(self.path, index)
+            with open(path, 'wb') as fp:
+                fp.write(content)
+
+            # when
+            loaded = cache.configure(path, save_at_exit=False)
+            stats = loaded.stats()
+            cls = define_class()
+
+            # then
+            self.assertEqual({'code': 0, 'facts': 0, 'hits': 0, 'misses': 0}, stats)
+            self.assertEqual(cls(1), cls(1))
+
+    def test_should_reuse_facts_for_constructor_with_nested_code(self):
+        # given
+        source = ('class Nested(DataObject):\n'
+                  '    def __init__(self, a):\n'
+                  '        self.a = a\n'
+                  '        self.b = [lambda: a]\n')
+
+        def define_nested_class():
+            namespace = {'DataObject': DataObject}
+            exec(compile(source, '<nested>', 'exec'), namespace)
+            return namespace['Nested']
+
+        cache.configure(self.path, save_at_exit=False)
+        define_nested_class().from_dict({'a': 1})
+        cache.save()
+
+        # when
+        loaded = cache.configure(self.path, save_at_exit=False)
+        facts = loaded.stats()['facts']
+        define_nested_class().from_dict({'a': 1})
+
+        # then
+        self.assertEqual(facts, loaded.stats()['facts'])
+        self.assertEqual(0, loaded.stats()['misses'])
+
+    def test_should_specialize_class_on_first_use_in_lazy_mode(self):
+        # given
+        cache.configure(lazy=True)
+        cls = define_class()
+        stub = cls.__dict__['__eq__']
+
+        # when
+        equal = cls(1) == cls(1)
+
+        # then
+        self.assertTrue(equal)
+        self.assertIsNot(stub, cls.__dict__['__eq__'])
+        self.assertTrue(getattr(cls.__dict__['__eq__'], '__specialized__', False))
+        self.assertEqual('Cached(a=1, b=None)', repr(cls(1)))
+        self.assertEqual(hash(cls(1)), hash(cls(1)))
+        self.assertIsNone(cache.active_cache())
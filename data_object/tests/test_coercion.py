@@ -0,0 +1,145 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Dict, List, Optional, Union
+from unittest import TestCase
+from uuid import UUID
+
+from data_object import DataObject, ImmutableDataObject
+from data_object.exceptions import CoercionError, RecordConversionError
+
+
+class Status(Enum):
+    NEW = 'new'
+    PAID = 'paid'
+
+
+class Line(ImmutableDataObject, coerce=True):
+    def __init__(self, quantity: int, price: Decimal):
+        self.quantity = quantity
+        self.price = price
+
+
+class Order(DataObject, coerce='strict'):
+    def __init__(self, number: int, created: datetime, status: Status, paid: bool, day: Optional[date] = None,
+                 lines: List[Line] = None, tags: Dict[str, float] = None, reference: UUID = None, note=None):
+        self.number = number
+        self.created = created
+        self.status = status
+        self.paid = paid
+        self.day = day
+        self.lines = lines
+        self.tags = tags
+        self.reference = reference
+        self.note = note
+
+
+class LenientOrder(DataObject, coerce='lenient'):
+    def __init__(self, number: int, amount: float, code: Union[int, str]):
+        self.number = number
+        self.amount = amount
+        self.code = code
+
+
+class TestCoercion(TestCase):
+
+    def test_should_convert_values_according_to_annotations(self):
+        # given
+        params = {'number': '12', 'created': '2024-01-02T03:04:05+00:00', 'status': 'paid', 'paid': 'yes',
+                  'day': '2024-01-02', 'lines': [{'quantity': 2.0, 'price': '1.50'}], 'tags': {'a': '1.5'},
+                  'reference': '12345678-1234-5678-1234-567812345678', 'note': '7'}
+
+        # when
+        result = Order.from_dict(params)
+
+        # then
+        self.assertEqual(12, result.number)
+        self.assertEqual(datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc), result.created)
+        self.assertIs(Status.PAID, result.status)
+        self.assertIs(True, result.paid)
+        self.assertEqual(date(2024, 1, 2), result.day)
+        self.assertEqual([Line(2, Decimal('1.50'))], result.lines)
+        self.assertIsInstance(result.lines[0].quantity, int)
+        self.assertEqual({'a': 1.5}, result.tags)
+        self.assertEqual(UUID('12345678-1234-5678-1234-567812345678'), result.reference)
+        self.assertEqual('7', result.note)
+
+    def test_should_keep_values_of_expected_type_and_none(self):
+        # given
+        created = datetime(2024, 1, 2)
+
+        # when
+        result = Order.from_dict({'number': 1, 'created': created, 'status': Status.NEW, 'paid': False}, True)
+
+        # then
+        self.assertEqual(1, result.number)
+        self.assertIs(created, result.created)
+        self.assertIsNone(result.day)
+
+    def test_should_report_all_invalid_fields(self):
+        # given
+        params = {'number': '1.5', 'created': 'yesterday', 'status': 'cancelled', 'paid': 'maybe'}
+
+        # when
+        with self.assertRaises(CoercionError) as context:
+            Order.from_dict(params)
+
+        # then
+        self.assertEqual({'number', 'created', 'status', 'paid'}, set(context.exception.errors))
+        self.assertIn('Order', str(context.exception))
+
+    def test_should_report_invalid_nested_object_as_field_error(self):
+        # given
+        params = {'number': 1, 'created': 0, 'status': 'new', 'paid': 1, 'lines': [{'quantity': 'x', 'price': 1}]}
+
+        # when
+        with self.assertRaises(CoercionError) as context:
+            Order.from_dict(params)
+
+        # then
+        self.assertEqual({'lines'}, set(context.exception.errors))
+        self.assertEqual({'quantity'}, set(context.exception.errors['lines'].errors))
+
+    def test_should_keep_raw_values_in_lenient_mode(self):
+        # when
+        result = LenientOrder.from_dict({'number': 'one', 'amount': '2.5', 'code': 7})
+
+        # then
+        self.assertEqual('one', result.number)
+        self.assertEqual(2.5, result.amount)
+        self.assertEqual(7, result.code)
+
+    def test_should_try_union_members_in_order(self):
+        # when
+        result = LenientOrder.from_dict({'number': 1, 'amount': 1, 'code': 2.0})
+
+        # then
+        self.assertEqual(2, result.code)
+        self.assertIsInstance(result.code, int)
+
+    def test_should_collect_coercion_errors_of_many_records(self):
+        # given
+        errors = []
+
+        # when
+        result = Line.from_dicts([{'quantity': '1', 'price': '2'}, {'quantity': 'x', 'price': 'y'}], errors=errors)
+
+        # then
+        self.assertEqual([Line(1, Decimal(2))], result)
+        self.assertIsInstance(errors[0], RecordConversionError)
+        self.assertEqual({'quantity', 'price'}, set(errors[0].cause.errors))
+
+    def test_should_not_convert_values_without_coercion(self):
+        # given
+        class Plain(DataObject):
+            def __init__(self, number: int):
+                self.number = number
+
+        # then
+        self.assertEqual('1', Plain.from_dict({'number': '1'}).number)
+
+    def test_should_reject_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyUnusedLocal
+            class Invalid(DataObject, coerce='sometimes'):
+                pass
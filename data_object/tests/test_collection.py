@@ -0,0 +1,141 @@
+from unittest import TestCase
+
+from data_object import DataObject, ImmutableDataObject, IndexedCollection
+
+
+class Order(ImmutableDataObject):
+    def __init__(self, number, status, price):
+        self.number = number
+        self.status = status
+        self.price = price
+
+
+class MutableOrder(DataObject):
+    def __init__(self, number, status, price):
+        self.number = number
+        self.status = status
+        self.price = price
+
+
+class TestIndexedCollection(TestCase):
+
+    def setUp(self):
+        self.orders = [Order(1, 'new', 10), Order(2, 'paid', 5), Order(3, 'new', 7), Order(4, 'paid', None)]
+        self.collection = IndexedCollection(Order, hash_fields=('status', 'number'), sorted_fields=('price',),
+                                            items=self.orders)
+
+    def test_should_find_items_by_hash_index(self):
+        # when
+        result = self.collection.find(status='new')
+
+        # then
+        self.assertEqual([self.orders[0], self.orders[2]], result)
+        self.assertEqual([self.orders[2]], self.collection.find(status='new', price=7))
+        self.assertEqual([], self.collection.find(status='cancelled'))
+
+    def test_should_find_items_by_sorted_index_or_scan(self):
+        # when
+        by_price = self.collection.find(price=5)
+        by_scan = IndexedCollection(Order, items=self.orders).find(status='paid')
+
+        # then
+        self.assertEqual([self.orders[1]], by_price)
+        self.assertEqual([self.orders[1], self.orders[3]], by_scan)
+
+    def test_should_find_items_in_range(self):
+        # then
+        self.assertEqual([self.orders[1], self.orders[2]], self.collection.range('price', 5, 7))
+        self.assertEqual([self.orders[2]], self.collection.range('price', 5, 10, include_low=False,
+                                                                 include_high=False))
+        self.assertEqual([self.orders[2], self.orders[0]], self.collection.range('price', low=6))
+        self.assertEqual([self.orders[1]], self.collection.range('price', high=6))
+
+    def test_should_remove_items_from_indexes(self):
+        # when
+        self.collection.remove(self.orders[0])
+        self.collection.discard(self.orders[0])
+
+        # then
+        self.assertEqual(3, len(self.collection))
+        self.assertNotIn(self.orders[0], self.collection)
+        self.assertEqual([self.orders[2]], self.collection.find(status='new'))
+        self.assertEqual([self.orders[1], self.orders[2]], self.collection.range('price'))
+        with self.assertRaises(KeyError):
+            self.collection.remove(self.orders[0])
+
+    def test_should_match_immutable_items_by_equality(self):
+        # given
+        duplicate = Order(1, 'new', 10)
+
+        # when
+        self.collection.add(duplicate)
+        contained = duplicate in self.collection
+        self.collection.remove(duplicate)
+
+        # then
+        self.assertTrue(contained)
+        self.assertEqual(3, len(self.collection))
+        self.assertEqual([], self.collection.find(number=1))
+        self.assertEqual([self.orders[1], self.orders[2]], self.collection.range('price'))
+
+    def test_should_match_mutable_items_by_identity(self):
+        # given
+        order = MutableOrder(1, 'new', 10)
+        collection = IndexedCollection(MutableOrder, hash_fields=('status',), items=[order])
+
+        # when
+        collection.add(MutableOrder(1, 'new', 10))
+
+        # then
+        self.assertEqual(2, len(collection))
+        self.assertNotIn(MutableOrder(1, 'new', 10), collection)
+        with self.assertRaises(KeyError):
+            collection.remove(MutableOrder(1, 'new', 10))
+
+    def test_should_not_index_item_with_unhashable_value(self):
+        # given
+        collection = IndexedCollection(MutableOrder, hash_fields=('number', 'status'), sorted_fields=('price',))
+
+        # when
+        with self.assertRaises(TypeError):
+            collection.add(MutableOrder(1, ['new'], 10))
+
+        # then
+        self.assertEqual(0, len(collection))
+        self.assertEqual([], collection.find(number=1))
+        self.assertEqual([], collection.range('price'))
+
+    def test_should_reindex_changed_mutable_item(self):
+        # given
+        order = MutableOrder(1, 'new', 10)
+        collection = IndexedCollection(MutableOrder, hash_fields=('status',), sorted_fields=('price',), items=[order])
+
+        # when
+        order.status = 'paid'
+        order.price = 3
+        collection.reindex(order)
+
+        # then
+        self.assertEqual([], collection.find(status='new'))
+        self.assertEqual([order], collection.find(status='paid'))
+        self.assertEqual([order], collection.range('price', 1, 5))
+
+    def test_should_find_items_with_none_in_sorted_field(self):
+        # when
+        result = self.collection.find(price=None)
+
+        # then
+        self.assertEqual([self.orders[3]], result)
+
+    def test_should_skip_stale_mutable_items_before_reindex(self):
+        # given
+        order = MutableOrder(1, 'new', 10)
+        collection = IndexedCollection(MutableOrder, hash_fields=('status',), sorted_fields=('price',), items=[order])
+
+        # when
+        order.status = 'paid'
+        order.price = 3
+
+        # then
+        self.assertEqual([], collection.find(status='new'))
+        self.assertEqual([], collection.find(price=10))
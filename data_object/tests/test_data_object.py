@@ -3,7 +3,7 @@ from enum import Enum
 from unittest import TestCase
 
 from data_object import DataObject
-from data_object.exceptions import ConstructorKeywordArgumentNotFound
+from data_object.exceptions import ConstructorKeywordArgumentNotFound, RecordConversionError, UnknownFieldError
 
 
 class TestDataObject(TestCase):
@@ -553,3 +553,270 @@ class TestDataObject(TestCase):
         self.assertIsInstance(inst2, SimpleClass)
         self.assertEqual(str(inst2), 'SimpleClass: {"bar": xyz, "foo": aa}')
         self.assertFalse(hasattr(inst2, 'zz'))
+
+    def test_should_create_instance_from_dict_with_child_constructor(self):
+        # given
+        class SimpleClass(DataObject):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        class ChildClass(SimpleClass):
+            def __init__(self, foo, bar, other='abc'):
+                super().__init__(foo, bar)
+                self.other = other
+
+        SimpleClass.from_dict({'foo': 'x', 'bar': 'y'})
+
+        # when
+        instance = ChildClass.from_dict({'foo': 'x', 'bar': 'y'})
+
+        # then
+        self.assertEqual('ChildClass: {"bar": y, "foo": x, "other": abc}', str(instance))
+
+    def test_should_create_instance_from_dict_after_constructor_replaced(self):
+        # given
+        class SimpleClass(DataObject):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        class ChildClass(SimpleClass):
+            pass
+
+        ChildClass.from_dict({'foo': 'x', 'bar': 'y'})
+
+        def new_init(self, foo):
+            self.foo = foo
+
+        # when
+        SimpleClass.__init__ = new_init
+        instance = ChildClass.from_dict({'foo': 'x', 'bar': 'y'})
+
+        # then
+        self.assertEqual('ChildClass: {"foo": x}', str(instance))
+
+    def test_should_pass_default_value_from_constructor_when_value_not_found(self):
+        # given
+        default = []
+
+        class SimpleClass(DataObject):
+            def __init__(self, foo, bar=default):
+                self.foo = foo
+                self.bar = bar
+
+        # when
+        instance = SimpleClass.from_dict({'foo': 'x'}, none_if_not_found=True)
+
+        # then
+        self.assertIs(instance.bar, default)
+
+    def test_should_get_instance_value_when_class_member_shadowed(self):
+        # given
+        class SimpleClass(DataObject):
+            foo = 'abc'
+
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        # when
+        instance = SimpleClass('x', 'y')
+
+        # then
+        self.assertEqual({'foo': 'x', 'bar': 'y'}, instance.as_json())
+
+    def test_should_get_class_member_changed_after_instance_created(self):
+        # given
+        class SimpleClass(DataObject):
+            class_member = 'xyz'
+
+            def __init__(self, foo):
+                self.foo = foo
+
+        instance = SimpleClass('x')
+        instance.as_json()
+
+        # when
+        SimpleClass.class_member = 'abc'
+        SimpleClass.other_member = 'def'
+
+        # then
+        self.assertEqual({'class_member': 'abc', 'other_member': 'def', 'foo': 'x'}, instance.as_json())
+
+    def test_should_create_instances_from_dicts(self):
+        # given
+        class SimpleClass(DataObject):
+            def __init__(self, foo, bar='xyz'):
+                self.foo = foo
+                self.bar = bar
+
+        data = [{'foo': 'x', 'bar': 'y'}, {'foo': 'z'}, {'bar': 'a'}]
+
+        # when
+        instances = SimpleClass.from_dicts(data, none_if_not_found=True)
+
+        # then
+        self.assertEqual(['SimpleClass(bar=y, foo=x)', 'SimpleClass(bar=xyz, foo=z)', 'SimpleClass(bar=a, foo=None)'],
+                         [repr(instance) for instance in instances])
+
+    def test_should_create_instances_lazily_from_dicts(self):
+        # given
+        class SimpleClass(DataObject):
+            def __init__(self, foo):
+                self.foo = foo
+
+        def records():
+            yield {'foo': 'x'}
+            raise AssertionError('Should not be consumed')
+
+        # when
+        instances = SimpleClass.iter_from_dicts(records())
+
+        # then
+        self.assertEqual('x', next(instances).foo)
+
+    def test_should_raise_exception_on_first_invalid_record(self):
+        # given
+        class SimpleClass(DataObject):
+            def __init__(self, foo):
+                self.foo = foo
+
+        data = [{'foo': 'x'}, {'bar': 'y'}]
+
+        # when
+        with self.assertRaisesRegex(ConstructorKeywordArgumentNotFound, "Constructor argument 'foo' not found"):
+            SimpleClass.from_dicts(data)
+
+    def test_should_collect_invalid_records(self):
+        # given
+        class SimpleClass(DataObject):
+            def __init__(self, foo):
+                self.foo = int(foo)
+
+        data = [{'foo': '1'}, {'bar': '2'}, {'foo': '3'}, {'foo': 'x'}]
+        errors = []
+
+        # when
+        instances = SimpleClass.from_dicts(data, errors=errors)
+
+        # then
+        self.assertEqual([1, 3], [instance.foo for instance in instances])
+        self.assertEqual([1, 3], [error.index for error in errors])
+        self.assertIsInstance(errors[0], RecordConversionError)
+        self.assertIsInstance(errors[0].cause, ConstructorKeywordArgumentNotFound)
+        self.assertIsInstance(errors[1].cause, ValueError)
+        self.assertEqual({'foo': 'x'}, errors[1].record)
+
+    def test_should_copy_instance_without_calling_plain_constructor(self):
+        # given
+        calls = []
+
+        class SimpleClass(DataObject):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        def new(cls):
+            calls.append(cls)
+            return object.__new__(cls)
+
+        new.__bypassable__ = True
+        inst1 = SimpleClass('abc', 'xyz')
+        SimpleClass.__new__ = new
+
+        # when
+        inst2 = inst1.copy(bar='aa', zz='cc')
+
+        # then
+        self.assertEqual([SimpleClass], calls)
+        self.assertEqual('SimpleClass: {"bar": aa, "foo": abc}', str(inst2))
+        self.assertEqual('SimpleClass: {"bar": xyz, "foo": abc}', str(inst1))
+
+    def test_should_call_constructor_on_copy_when_constructor_not_plain(self):
+        # given
+        class SimpleClass(DataObject):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+                self._joined = foo + bar
+
+        inst1 = SimpleClass('abc', 'xyz')
+
+        # when
+        inst2 = inst1.copy(bar='aa')
+
+        # then
+        self.assertEqual('abcaa', inst2._joined)
+
+    def test_should_call_constructor_on_copy_when_class_defines_new(self):
+        # given
+        class SimpleClass(DataObject):
+            def __new__(cls, foo, bar):
+                instance = super().__new__(cls)
+                instance._created_with = (foo, bar)
+                return instance
+
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        inst1 = SimpleClass('abc', 'xyz')
+
+        # when
+        inst2 = inst1.copy(bar='aa')
+        inst3 = inst1.evolve(foo='x')
+
+        # then
+        self.assertEqual(('abc', 'aa'), inst2._created_with)
+        self.assertEqual(('x', 'xyz'), inst3._created_with)
+
+    def test_should_call_property_setter_on_copy(self):
+        # given
+        class SimpleClass(DataObject):
+            def __init__(self, foo):
+                self.foo = foo
+
+            @property
+            def foo(self):
+                return self._foo
+
+            @foo.setter
+            def foo(self, value):
+                self._foo = value.upper()
+
+        inst1 = SimpleClass('abc')
+
+        # when
+        inst2 = inst1.copy(foo='xyz')
+
+        # then
+        self.assertEqual('XYZ', inst2.foo)
+
+    def test_should_evolve_instance(self):
+        # given
+        class SimpleClass(DataObject):
+            def __init__(self, foo, bar='xyz'):
+                self.foo = foo
+                self.bar = bar
+
+        inst1 = SimpleClass('abc')
+
+        # when
+        inst2 = inst1.evolve(foo='aa')
+
+        # then
+        self.assertEqual('SimpleClass: {"bar": xyz, "foo": aa}', str(inst2))
+
+    def test_should_raise_exception_on_evolve_with_unknown_fields(self):
+        # given
+        class SimpleClass(DataObject):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        inst1 = SimpleClass('abc', 'xyz')
+
+        # when
+        with self.assertRaisesRegex(UnknownFieldError, 'Unknown fields: aa, zz'):
+            inst1.evolve(foo='aa', zz='cc', aa='dd')
@@ -0,0 +1,118 @@
+from array import array
+from unittest import TestCase
+
+from data_object import DataObject, DataObjectFrame
+
+
+class SimpleClass(DataObject):
+    def __init__(self, foo, bar, baz):
+        self.foo = foo
+        self.bar = bar
+        self.baz = baz
+
+
+class TestDataObjectFrame(TestCase):
+
+    def setUp(self):
+        self.objects = [SimpleClass(1, 0.5, 'a'), SimpleClass(2, 1.5, 'b'), SimpleClass(3, 2.5, None)]
+
+    def test_should_store_fields_as_columns(self):
+        # when
+        frame = DataObjectFrame.from_objects(SimpleClass, self.objects)
+
+        # then
+        self.assertEqual(3, len(frame))
+        self.assertEqual(('foo', 'bar', 'baz'), frame.fields)
+        self.assertEqual([1, 2, 3], list(frame.column('foo')))
+        self.assertEqual([0.5, 1.5, 2.5], list(frame.column('bar')))
+        self.assertEqual(['a', 'b', None], frame.column('baz'))
+
+    def test_should_use_compact_storage_for_numeric_columns(self):
+        # when
+        frame = DataObjectFrame.from_objects(SimpleClass, self.objects)
+
+        # then
+        self.assertNotIsInstance(frame.column('foo'), list)
+        self.assertNotIsInstance(frame.column('bar'), list)
+        self.assertIsInstance(frame.column('baz'), list)
+
+    def test_should_keep_list_for_mixed_or_big_numbers(self):
+        # when
+        frame = DataObjectFrame.from_dicts(SimpleClass, [{'foo': 1, 'bar': 2 ** 70, 'baz': True},
+                                                         {'foo': 1.5, 'bar': 1, 'baz': False}])
+
+        # then
+        self.assertEqual([1, 1.5], frame.column('foo'))
+        self.assertEqual([2 ** 70, 1], frame.column('bar'))
+        self.assertEqual([True, False], frame.column('baz'))
+
+    def test_should_materialize_rows(self):
+        # given
+        frame = DataObjectFrame.from_objects(SimpleClass, self.objects)
+
+        # when
+        row = frame[-1]
+
+        # then
+        self.assertIsInstance(row, SimpleClass)
+        self.assertIs(type(row.foo), int)
+        self.assertEqual(self.objects[2], row)
+        self.assertEqual(self.objects, list(frame))
+        self.assertEqual(self.objects[1:], list(frame[1:]))
+        with self.assertRaises(IndexError):
+            frame[3]
+
+    def test_should_filter_rows_by_field_value(self):
+        # given
+        frame = DataObjectFrame.from_objects(SimpleClass, self.objects)
+
+        # when
+        result = frame.where('foo', 2, op='>=')
+
+        # then
+        self.assertEqual(self.objects[1:], list(result))
+        self.assertEqual(self.objects[:1], list(frame.where('baz', 'a')))
+        self.assertEqual(0, len(frame.where('bar', 10.0, op='>')))
+
+    def test_should_skip_none_values_when_ordering_rows(self):
+        # given
+        objects = [SimpleClass(1, 0.5, 'a'), SimpleClass(None, 1.5, 'b'), SimpleClass(3, 2.5, 'c')]
+        frame = DataObjectFrame.from_objects(SimpleClass, objects)
+
+        # when
+        result = frame.where('foo', 1, op='>')
+
+        # then
+        self.assertIsInstance(frame.column('foo'), list)
+        self.assertEqual(objects[2:], list(result))
+        self.assertEqual(objects[1:2], list(frame.where('foo', None)))
+
+    def test_should_get_frame_as_records_and_json(self):
+        # given
+        frame = DataObjectFrame.from_dicts(SimpleClass, [{'foo': 1, 'bar': 0.5, 'baz': 'a'}, {'foo': 2, 'bar': 1.5}])
+
+        # when
+        records = frame.to_records()
+        json = frame.as_json()
+
+        # then
+        self.assertEqual([(1, 0.5, 'a'), (2, 1.5, None)], records)
+        self.assertEqual([{'foo': 1, 'bar': 0.5, 'baz': 'a'}, {'foo': 2, 'bar': 1.5, 'baz': None}], json)
+
+    def test_should_use_array_module_without_numpy(self):
+        # given
+        from data_object import frame as frame_module
+        numpy = frame_module.numpy
+        frame_module.numpy = None
+
+        # when
+        try:
+            frame = DataObjectFrame.from_objects(SimpleClass, self.objects)
+            result = frame.where('foo', 1, op='!=')
+        finally:
+            frame_module.numpy = numpy
+
+        # then
+        self.assertIsInstance(frame.column('foo'), array)
+        self.assertEqual('q', frame.column('foo').typecode)
+        self.assertEqual(array('d', [1.5, 2.5]), result.column('bar'))
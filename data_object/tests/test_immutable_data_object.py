@@ -1,3 +1,5 @@
+import copy
+import pickle
 from unittest import TestCase
 
 from data_object import ImmutableDataObject
@@ -46,3 +48,118 @@ class TestImmutableDataObject(TestCase):
         # then
         self.assertEqual(result.foo, 'x')
         self.assertEqual(result.bar, 'abc')
+
+    def test_should_raise_exception_on_adding_attribute_after_construction(self):
+        # given
+        class SimpleClass(ImmutableDataObject):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        instance = SimpleClass('x', 'y')
+
+        # when
+        with self.assertRaisesRegex(ImmutableObjectViolation, 'Changing attributes not permitted for immutable object'):
+            instance.other = 'abc'
+
+    def test_should_allow_reassigning_attribute_in_constructor(self):
+        # given
+        class SimpleClass(ImmutableDataObject):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+                self.foo = foo.upper()
+
+        # when
+        instance = SimpleClass('x', 'y')
+
+        # then
+        self.assertEqual('SimpleClass: {"bar": y, "foo": X}', str(instance))
+
+    def test_should_freeze_instance_of_child_class_after_construction(self):
+        # given
+        class SimpleClass(ImmutableDataObject):
+            def __init__(self, foo):
+                self.foo = foo
+
+        class ChildClass(SimpleClass):
+            def __init__(self, foo, bar):
+                super().__init__(foo)
+                self.bar = bar
+
+        # when
+        instance = ChildClass('x', 'y')
+
+        # then
+        self.assertEqual('ChildClass: {"bar": y, "foo": x}', str(instance))
+        with self.assertRaises(ImmutableObjectViolation):
+            instance.foo = 'z'
+
+    def test_should_cache_hash_json_and_repr(self):
+        # given
+        calls = []
+
+        class SimpleClass(ImmutableDataObject):
+            def __init__(self, foo):
+                self.foo = foo
+
+            @property
+            def other(self):
+                calls.append(1)
+                return self.foo * 2
+
+        instance = SimpleClass('x')
+
+        # when
+        hash(instance)
+        hash(instance)
+        repr(instance)
+        json = instance.as_json()
+        json['foo'] = 'changed'
+
+        # then
+        self.assertEqual(1, len(calls))
+        self.assertEqual({'foo': 'x', 'other': 'xx'}, instance.as_json())
+        self.assertEqual('SimpleClass(foo=x, other=xx)', repr(instance))
+
+    def test_should_pickle_and_copy_frozen_instance(self):
+        # given
+        instance = PicklableClass('x', 'y')
+        hash(instance)
+
+        # when
+        unpickled = pickle.loads(pickle.dumps(instance))
+        copied = copy.copy(instance)
+
+        # then
+        for result in (unpickled, copied):
+            self.assertEqual(instance, result)
+            self.assertEqual(hash(instance), hash(result))
+            with self.assertRaises(ImmutableObjectViolation):
+                result.foo = 'z'
+
+    def test_should_freeze_copied_instance(self):
+        # given
+        class SimpleClass(ImmutableDataObject):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        instance = SimpleClass('x', 'y')
+        hash(instance)
+
+        # when
+        result = instance.evolve(bar='abc')
+
+        # then
+        self.assertEqual(hash(SimpleClass('x', 'abc')), hash(result))
+        self.assertEqual('SimpleClass(bar=abc, foo=x)', repr(result))
+        with self.assertRaises(ImmutableObjectViolation):
+            result.foo = 'z'
+
+
+class PicklableClass(ImmutableDataObject):
+    def __init__(self, foo, bar):
+        self.foo = foo
+        self.bar = bar
+
@@ -0,0 +1,119 @@
+import io
+import json
+from unittest import TestCase
+
+from data_object import DataObject, ImmutableDataObject, instrumentation
+
+
+class Measured(ImmutableDataObject):
+    def __init__(self, a):
+        self.a = a
+
+
+class TestInstrumentation(TestCase):
+
+    def setUp(self):
+        instrumentation.reset()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_should_count_calls_per_class_and_operation(self):
+        # given
+        instrumentation.enable()
+
+        # when
+        instance = Measured.from_dict({'a': 1})
+        instance.as_json()
+        hash(instance)
+        str(instance)
+        _ = instance == Measured(1)
+        instance.copy(a=2)
+
+        # then
+        stats = instrumentation.snapshot()[Measured.__module__ + '.Measured']
+        self.assertEqual({'from_dict', 'as_json', 'hash', 'str', 'eq', 'copy'}, set(stats))
+        self.assertEqual(1, stats['hash']['calls'])
+        self.assertEqual(1, stats['from_dict']['calls'])
+        self.assertGreaterEqual(stats['from_dict']['time'], 0)
+
+    def test_should_count_overridden_from_dict_once(self):
+        # given
+        class Child(Measured):
+            @classmethod
+            def from_dict(cls, params, *args, **kwargs):
+                return super().from_dict(params, *args, **kwargs)
+
+        instrumentation.enable()
+
+        # when
+        Child.from_dict({'a': 1})
+
+        # then
+        stats = instrumentation.snapshot()[Child.__module__ + '.' + Child.__qualname__]
+        self.assertEqual(1, stats['from_dict']['calls'])
+
+    def test_should_sum_stats_of_classes_with_same_name(self):
+        # given
+        def define_class():
+            class Twin(DataObject):
+                def __init__(self, a):
+                    self.a = a
+            return Twin
+
+        first, second = define_class(), define_class()
+        instrumentation.enable()
+
+        # when
+        first(1).as_json()
+        second(2).as_json()
+
+        # then
+        stats = instrumentation.snapshot()[first.__module__ + '.' + first.__qualname__]
+        self.assertEqual(2, stats['as_json']['calls'])
+
+    def test_should_restore_original_methods_when_disabled(self):
+        # given
+        originals = {name: DataObject.__dict__[name] for name in ('as_json', '__eq__', '__hash__')}
+        instrumentation.enable()
+
+        # when
+        instrumentation.disable()
+        Measured(1).as_json()
+
+        # then
+        self.assertEqual(originals, {name: DataObject.__dict__[name] for name in originals})
+        self.assertEqual({}, instrumentation.snapshot())
+
+    def test_should_instrument_classes_created_and_specialized_while_enabled(self):
+        with instrumentation.instrumented():
+            # given
+            class SomeClass(DataObject, specialized=True):
+                def __init__(self, a):
+                    self.a = a
+
+            # when
+            _ = SomeClass(1) == SomeClass(1)
+            SomeClass.extra = 1
+            _ = SomeClass(1) == SomeClass(1)
+
+        # then
+        stats = instrumentation.snapshot()[SomeClass.__module__ + '.' + SomeClass.__qualname__]
+        self.assertEqual(2, stats['eq']['calls'])
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertFalse(hasattr(SomeClass.__eq__, '__instrumented__'))
+
+    def test_should_export_and_reset_stats(self):
+        # given
+        with instrumentation.instrumented():
+            Measured(1).as_json()
+        output = io.StringIO()
+
+        # when
+        instrumentation.export(output)
+        instrumentation.reset()
+
+        # then
+        self.assertEqual(1, json.loads(output.getvalue())[Measured.__module__ + '.Measured']['as_json']['calls'])
+        self.assertEqual({}, instrumentation.snapshot())
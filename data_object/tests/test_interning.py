@@ -0,0 +1,96 @@
+import gc
+from unittest import TestCase
+
+from data_object import DataObject, ImmutableDataObject, ImmutableSlottedDataObject
+
+
+class Currency(ImmutableDataObject, interned=True):
+    def __init__(self, code, precision=2):
+        self.code = code
+        self.precision = precision
+
+
+class SlottedCurrency(ImmutableSlottedDataObject, interned=2):
+    def __init__(self, code):
+        self.code = code
+
+
+class TestInterning(TestCase):
+
+    def setUp(self):
+        Currency._ImmutableDataObject__interned.clear()
+        SlottedCurrency._ImmutableDataObject__interned.clear()
+
+    def test_should_return_canonical_instance_for_equal_values(self):
+        # when
+        first = Currency('USD')
+        results = [Currency('USD', 2), Currency(code='USD'), Currency.from_dict({'code': 'USD'}), first.copy()]
+
+        # then
+        for result in results:
+            self.assertIs(first, result)
+        other = Currency('EUR')
+        self.assertIsNot(first, other)
+        self.assertEqual({'size': 2, 'limit': 100000, 'hits': 4, 'misses': 2, 'hit_rate': 4 / 6},
+                         Currency.intern_stats())
+
+    def test_should_not_mix_values_of_different_types(self):
+        # when
+        result = Currency('USD', 2.0)
+
+        # then
+        self.assertIsNot(Currency('USD', 2), result)
+        self.assertEqual(2.0, result.precision)
+
+    def test_should_not_intern_unhashable_values(self):
+        # when
+        first = Currency(['USD'])
+        second = Currency(['USD'])
+
+        # then
+        self.assertIsNot(first, second)
+        self.assertEqual(first, second)
+        self.assertEqual(0, Currency.intern_stats()['size'])
+
+    def test_should_bound_table_size_and_release_unused_instances(self):
+        # given
+        kept = [SlottedCurrency(code) for code in ('USD', 'EUR', 'GBP')]
+
+        # when
+        size = SlottedCurrency.intern_stats()['size']
+        del kept
+        gc.collect()
+
+        # then
+        self.assertEqual(2, size)
+        self.assertEqual(0, SlottedCurrency.intern_stats()['size'])
+        self.assertIs(SlottedCurrency('PLN'), SlottedCurrency('PLN'))
+
+    def test_should_intern_subclass_in_own_table(self):
+        # given
+        class Crypto(Currency):
+            pass
+
+        # when
+        result = Crypto('BTC')
+
+        # then
+        self.assertIs(result, Crypto('BTC'))
+        self.assertIsNot(result, Currency('BTC'))
+        self.assertEqual(1, Crypto.intern_stats()['hits'])
+
+    def test_should_not_allow_interning_mutable_class(self):
+        with self.assertRaises(TypeError):
+            # noinspection PyUnusedLocal
+            class SomeClass(DataObject, interned=True):
+                pass
+
+    def test_should_return_no_stats_when_not_interned(self):
+        # given
+        class SomeClass(ImmutableDataObject):
+            def __init__(self, a):
+                self.a = a
+
+        # then
+        self.assertIsNone(SomeClass.intern_stats())
+        self.assertIsNot(SomeClass(1), SomeClass(1))
@@ -0,0 +1,133 @@
+from typing import Dict, List, Optional, Tuple
+from unittest import TestCase
+
+from data_object import DataObject, ImmutableDataObject
+from data_object.exceptions import CyclicReferenceError, NestingTooDeepError
+
+
+class Leaf(ImmutableDataObject):
+    def __init__(self, name: str):
+        self.name = name
+
+
+class Branch(DataObject):
+    def __init__(self, leaf: Leaf, leaves: List[Leaf], by_name: Dict[str, Leaf], other: Optional[Leaf] = None,
+                 pair: Tuple[Leaf, ...] = ()):
+        self.leaf = leaf
+        self.leaves = leaves
+        self.by_name = by_name
+        self.other = other
+        self.pair = pair
+
+
+class Node(DataObject):
+    def __init__(self, value: int, children: 'List[Node]'):
+        self.value = value
+        self.children = children
+
+
+class TestNestedDataObject(TestCase):
+
+    def test_should_create_nested_objects_from_dict(self):
+        # given
+        data = {'leaf': {'name': 'a'}, 'leaves': [{'name': 'b'}, Leaf('c')], 'by_name': {'d': {'name': 'd'}},
+                'pair': ({'name': 'e'},)}
+
+        # when
+        instance = Branch.from_dict(data)
+
+        # then
+        self.assertEqual(Leaf('a'), instance.leaf)
+        self.assertIsInstance(instance.leaf, Leaf)
+        self.assertEqual([Leaf('b'), Leaf('c')], instance.leaves)
+        self.assertEqual({'d': Leaf('d')}, instance.by_name)
+        self.assertIsNone(instance.other)
+        self.assertEqual((Leaf('e'),), instance.pair)
+
+    def test_should_create_nested_objects_from_dict_with_declared_field_types(self):
+        # given
+        class SimpleClass(DataObject):
+            __field_types__ = {'children': List[Leaf]}
+
+            def __init__(self, children):
+                self.children = children
+
+        # when
+        instance = SimpleClass.from_dict({'children': [{'name': 'a'}]})
+
+        # then
+        self.assertEqual([Leaf('a')], instance.children)
+
+    def test_should_create_recursive_structure_from_dicts(self):
+        # given
+        data = [{'value': 1, 'children': [{'value': 2, 'children': []}]}, {'value': 3, 'children': []}]
+
+        # when
+        instances = Node.from_dicts(data)
+
+        # then
+        self.assertIsInstance(instances[0].children[0], Node)
+        self.assertEqual(2, instances[0].children[0].value)
+
+    def test_should_get_nested_objects_as_json(self):
+        # given
+        instance = Branch(Leaf('a'), [Leaf('b')], {'c': Leaf('c')}, pair=(Leaf('d'),))
+
+        # when
+        result = instance.as_json(recursive=True)
+
+        # then
+        self.assertEqual({'leaf': {'name': 'a'}, 'leaves': [{'name': 'b'}], 'by_name': {'c': {'name': 'c'}},
+                          'other': None, 'pair': [{'name': 'd'}]}, result)
+        self.assertIsInstance(instance.as_json()['leaf'], Leaf)
+
+    def test_should_restore_object_from_recursive_json(self):
+        # given
+        instance = Node(1, [Node(2, [Node(3, [])])])
+
+        # when
+        result = Node.from_dict(instance.as_json(recursive=True))
+
+        # then
+        self.assertEqual(instance, result)
+
+    def test_should_raise_exception_when_nesting_too_deep(self):
+        # given
+        data = {'value': 0, 'children': []}
+        for value in range(1, 6):
+            data = {'value': value, 'children': [data]}
+        instance = Node.from_dict(data)
+
+        # when
+        with self.assertRaisesRegex(NestingTooDeepError, 'Nesting deeper than 3 levels'):
+            Node.from_dict(data, max_depth=3)
+        with self.assertRaises(NestingTooDeepError):
+            instance.as_json(recursive=True, max_depth=3)
+
+    def test_should_raise_exception_on_cyclic_reference(self):
+        # given
+        data = {'value': 1, 'children': []}
+        data['children'].append(data)
+        instance = Node(1, [])
+        instance.children.append(instance)
+
+        # when
+        with self.assertRaises(CyclicReferenceError):
+            Node.from_dict(data)
+        with self.assertRaises(CyclicReferenceError):
+            instance.as_json(recursive=True)
+        with self.assertRaises(CyclicReferenceError):
+            instance.to_json()
+
+    def test_should_allow_shared_object_in_many_places(self):
+        # given
+        leaf = Leaf('a')
+        data = {'name': 'a'}
+
+        # when
+        instance = Branch.from_dict({'leaf': data, 'leaves': [data, data], 'by_name': {}})
+        result = Branch(leaf, [leaf, leaf], {}).as_json(recursive=True)
+
+        # then
+        self.assertEqual([Leaf('a'), Leaf('a')], instance.leaves)
+        self.assertEqual([{'name': 'a'}, {'name': 'a'}], result['leaves'])
@@ -0,0 +1,105 @@
+from unittest import TestCase
+
+from data_object import DataObject, ImmutableDataObject, ImmutableSlottedDataObject, merge_sorted
+
+
+class Trade(ImmutableDataObject, order=('symbol', 'price')):
+    def __init__(self, symbol, price, quantity):
+        self.symbol = symbol
+        self.price = price
+        self.quantity = quantity
+
+
+class SlottedTrade(ImmutableSlottedDataObject, order='price'):
+    def __init__(self, symbol, price):
+        self.symbol = symbol
+        self.price = price
+
+
+class MutableTrade(DataObject, order=('price',)):
+    def __init__(self, symbol, price):
+        self.symbol = symbol
+        self.price = price
+
+
+class TestOrdering(TestCase):
+
+    def test_should_compare_by_order_fields(self):
+        # given
+        first = Trade('ABC', 10, 5)
+        second = Trade('ABC', 12, 1)
+
+        # then
+        self.assertTrue(first < second)
+        self.assertTrue(first <= second)
+        self.assertTrue(second > first)
+        self.assertTrue(second >= first)
+        self.assertTrue(first <= Trade('ABC', 10, 7))
+        self.assertFalse(first < Trade('ABC', 10, 7))
+
+    def test_should_sort_instances(self):
+        # given
+        trades = [Trade('XYZ', 1, 1), Trade('ABC', 3, 1), Trade('ABC', 2, 1)]
+
+        # when
+        result = sorted(trades)
+
+        # then
+        self.assertEqual([trades[2], trades[1], trades[0]], result)
+        self.assertEqual(result, sorted(trades, key=Trade.sort_key))
+
+    def test_should_cache_sort_key_on_immutable_instance(self):
+        for instance in (Trade('ABC', 1, 2), SlottedTrade('ABC', 1)):
+            # when
+            key = instance.sort_key()
+
+            # then
+            self.assertIs(key, instance.sort_key())
+            self.assertNotIn('sort_key', instance.as_json())
+
+    def test_should_compute_sort_key_of_mutable_instance_on_every_call(self):
+        # given
+        trade = MutableTrade('ABC', 1)
+
+        # when
+        trade.price = 5
+
+        # then
+        self.assertEqual((5,), trade.sort_key())
+        self.assertTrue(MutableTrade('ABC', 2) < trade)
+
+    def test_should_not_compare_with_other_types(self):
+        with self.assertRaises(TypeError):
+            _ = Trade('ABC', 1, 1) < 5
+
+    def test_should_keep_methods_defined_in_class(self):
+        # given
+        class Reversed(DataObject, order='value'):
+            def __init__(self, value):
+                self.value = value
+
+            def __lt__(self, other):
+                return self.value > other.value
+
+        # then
+        self.assertTrue(Reversed(2) < Reversed(1))
+        self.assertTrue(Reversed(1) <= Reversed(2))
+
+    def test_should_reject_invalid_order(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyUnusedLocal
+            class Invalid(DataObject, order=()):
+                pass
+
+    def test_should_merge_sorted_streams(self):
+        # given
+        first = [SlottedTrade('A', price) for price in (1, 4, 7)]
+        second = [SlottedTrade('B', price) for price in (2, 3, 9)]
+
+        # when
+        result = list(merge_sorted(first, iter(second)))
+
+        # then
+        self.assertEqual([1, 2, 3, 4, 7, 9], [trade.price for trade in result])
+        self.assertEqual([9, 7, 4, 3, 2, 1],
+                         [trade.price for trade in merge_sorted(first[::-1], second[::-1], reverse=True)])
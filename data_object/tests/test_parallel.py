@@ -0,0 +1,82 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from data_object import DataObject, ImmutableDataObject, parallel_as_json, parallel_from_dicts
+from data_object.exceptions import ConstructorKeywordArgumentNotFound
+
+
+class Record(ImmutableDataObject):
+    def __init__(self, number, name):
+        self.number = number
+        self.name = name
+
+
+class Wrapper(DataObject):
+    def __init__(self, record: Record, tags=None):
+        self.record = record
+        self.tags = tags or []
+
+
+class TestParallel(TestCase):
+
+    def setUp(self):
+        self.records = [{'number': index, 'name': str(index)} for index in range(100)]
+
+    def test_should_convert_dicts_in_processes_in_order(self):
+        # when
+        result = list(parallel_from_dicts(Record, self.records, processes=2, chunk_size=7, min_parallel=10))
+
+        # then
+        self.assertEqual(Record.from_dicts(self.records), result)
+        self.assertTrue(all(instance._ImmutableDataObject__frozen for instance in result))
+
+    def test_should_stream_unordered_results(self):
+        with ThreadPoolExecutor(3) as executor:
+            # when
+            result = list(parallel_from_dicts(Record, iter(self.records), chunk_size=9, ordered=False,
+                                              min_parallel=10, executor=executor))
+
+        # then
+        self.assertEqual(list(range(100)), sorted(instance.number for instance in result))
+
+    def test_should_convert_serially_small_input(self):
+        # given
+        records = self.records[:5]
+
+        # when
+        result = list(parallel_from_dicts(Record, records))
+
+        # then
+        self.assertEqual(Record.from_dicts(records), result)
+
+    def test_should_convert_nested_objects(self):
+        # given
+        records = [{'record': record, 'tags': ['a']} for record in self.records]
+
+        # when
+        result = list(parallel_from_dicts(Wrapper, records, processes=2, chunk_size=30, min_parallel=10))
+
+        # then
+        self.assertEqual(Wrapper.from_dicts(records), result)
+        self.assertEqual(records, list(parallel_as_json(Wrapper, result, processes=2, chunk_size=30,
+                                                        min_parallel=10)))
+
+    def test_should_dump_objects_as_json(self):
+        # given
+        objects = Record.from_dicts(self.records)
+
+        # when
+        result = list(parallel_as_json(Record, objects, processes=2, chunk_size=11, min_parallel=10))
+        serial = list(parallel_as_json(Record, objects, processes=1))
+
+        # then
+        self.assertEqual(self.records, result)
+        self.assertEqual(self.records, serial)
+
+    def test_should_raise_conversion_error_from_worker(self):
+        # given
+        records = self.records + [{'number': 1}]
+
+        # then
+        with self.assertRaises(ConstructorKeywordArgumentNotFound):
+            list(parallel_from_dicts(Record, records, processes=2, chunk_size=50, min_parallel=10))
@@ -0,0 +1,163 @@
+import pickle
+from unittest import TestCase
+
+from data_object import DataObject, ImmutableDataObject, ImmutableSlottedDataObject, cached_property
+
+
+class Counter:
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, value):
+        self.calls += 1
+        return value
+
+
+class TestProperties(TestCase):
+
+    def test_should_not_evaluate_properties_on_equality_and_hash(self):
+        # given
+        counter = Counter()
+
+        class SomeClass(DataObject):
+            def __init__(self, a):
+                self.a = a
+
+            @property
+            def doubled(self):
+                return counter(self.a * 2)
+
+        # when
+        equal = SomeClass(1) == SomeClass(1)
+        same_hash = hash(SomeClass(1)) == hash(SomeClass(1))
+
+        # then
+        self.assertTrue(equal)
+        self.assertTrue(same_hash)
+        self.assertEqual(0, counter.calls)
+        self.assertEqual({'a': 1, 'doubled': 2}, SomeClass(1).as_json())
+
+    def test_should_compare_opted_in_properties(self):
+        for specialized in (False, True):
+            # given
+            class SomeClass(DataObject, compare_properties=('label',), specialized=specialized):
+                def __init__(self, a):
+                    self.a = a
+
+                @property
+                def label(self):
+                    return self.__dict__.get('b', self.a)
+
+            first = SomeClass(1)
+            second = SomeClass(1)
+            second.__dict__['b'] = 2
+
+            # then
+            self.assertNotEqual(first, second)
+            self.assertEqual(first, SomeClass(1))
+
+    def test_should_compare_properties_exposing_constructor_arguments(self):
+        for base in (DataObject, ImmutableDataObject):
+            for specialized in (False, True):
+                # given
+                class SomeClass(base, specialized=specialized, properties=()):
+                    def __init__(self, name):
+                        self._name = name
+
+                    @property
+                    def name(self):
+                        return self._name
+
+                # then
+                self.assertNotEqual(SomeClass('a'), SomeClass('b'))
+                self.assertEqual(SomeClass('a'), SomeClass('a'))
+                self.assertEqual(2, len({SomeClass('a'), SomeClass('b')}))
+                self.assertEqual({'name': 'a'}, SomeClass('a').as_json())
+
+    def test_should_select_properties_returned_as_json(self):
+        # given
+        class SomeClass(DataObject, properties=('shown',)):
+            def __init__(self, a):
+                self.a = a
+
+            @property
+            def shown(self):
+                return 'x'
+
+            @property
+            def hidden(self):
+                return 'y'
+
+        class OtherClass(SomeClass, properties=False):
+            @property
+            def shown(self):
+                return 'z'
+
+        # then
+        self.assertEqual({'a': 1, 'shown': 'x'}, SomeClass(1).as_json())
+        self.assertEqual('SomeClass(a=1, shown=x)', repr(SomeClass(1)))
+        self.assertEqual({'a': 1}, OtherClass(1).as_json())
+
+    def test_should_compute_cached_property_once_on_immutable(self):
+        for base in (ImmutableDataObject, ImmutableSlottedDataObject):
+            # given
+            counter = Counter()
+
+            class SomeClass(base):
+                def __init__(self, a):
+                    self.a = a
+
+                @cached_property
+                def doubled(self):
+                    return counter(self.a * 2)
+
+            instance = SomeClass(2)
+
+            # when
+            values = [instance.doubled, instance.doubled, instance.as_json()['doubled'], str(instance)]
+
+            # then
+            self.assertEqual([4, 4, 4, 'SomeClass: {"a": 2, "doubled": 4}'], values)
+            self.assertEqual(1, counter.calls)
+            self.assertEqual(6, instance.copy(a=3).doubled)
+
+    def test_should_compute_cached_property_on_every_access_on_mutable(self):
+        # given
+        class SomeClass(DataObject):
+            def __init__(self, a):
+                self.a = a
+
+            @cached_property
+            def doubled(self):
+                return self.a * 2
+
+        instance = SomeClass(1)
+
+        # when
+        instance.a = 5
+
+        # then
+        self.assertEqual(10, instance.doubled)
+
+    def test_should_not_pickle_cached_values(self):
+        # given
+        instance = CachedClass(3)
+        _ = instance.doubled
+
+        # when
+        result = pickle.loads(pickle.dumps(instance))
+
+        # then
+        self.assertNotIn('_ImmutableDataObject__cache', result.__dict__)
+        self.assertEqual(6, result.doubled)
+        self.assertEqual(instance, result)
+
+
+class CachedClass(ImmutableDataObject):
+    def __init__(self, a):
+        self.a = a
+
+    @cached_property
+    def doubled(self):
+        return self.a * 2
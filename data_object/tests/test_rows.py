@@ -0,0 +1,96 @@
+import sqlite3
+from unittest import TestCase
+
+from data_object import DataObject, ImmutableDataObject
+from data_object.exceptions import ConstructorKeywordArgumentNotFound, RecordConversionError
+
+
+class Trade(ImmutableDataObject):
+    def __init__(self, symbol, price, quantity=1):
+        self.symbol = symbol
+        self.price = price
+        self.quantity = quantity
+
+
+class Parent(DataObject):
+    def __init__(self, name, child: Trade):
+        self.name = name
+        self.child = child
+
+
+class CountingCursor:
+
+    def __init__(self, cursor) -> None:
+        self.cursor = cursor
+        self.fetches = []
+
+    @property
+    def description(self):
+        return self.cursor.description
+
+    def fetchmany(self, size):
+        rows = self.cursor.fetchmany(size)
+        self.fetches.append(len(rows))
+        return rows
+
+
+class TestRows(TestCase):
+
+    def test_should_create_instances_from_rows_by_column_names(self):
+        # given
+        rows = [(10.5, 'ABC', 3, 'ignored'), (2.0, 'XYZ', 1, 'ignored')]
+
+        # when
+        result = Trade.from_rows(rows, ('price', 'symbol', 'quantity', 'other'))
+
+        # then
+        self.assertEqual([Trade('ABC', 10.5, 3), Trade('XYZ', 2.0, 1)], result)
+
+    def test_should_use_defaults_and_missing_columns(self):
+        # given
+        rows = [('ABC',)]
+
+        # when
+        with_defaults = Trade.from_rows([('ABC', 1.0)], ('symbol', 'price'))
+        with_none = Trade.from_rows(rows, ('symbol',), none_if_not_found=True)
+
+        # then
+        self.assertEqual([Trade('ABC', 1.0, 1)], with_defaults)
+        self.assertEqual([Trade('ABC', None, 1)], with_none)
+        with self.assertRaises(ConstructorKeywordArgumentNotFound):
+            Trade.from_rows(rows, ('symbol',))
+
+    def test_should_collect_errors_of_invalid_rows(self):
+        # given
+        errors = []
+
+        # when
+        result = Trade.from_rows([('ABC', 1.0), ('XYZ',)], ('symbol', 'price'), errors=errors)
+
+        # then
+        self.assertEqual([Trade('ABC', 1.0)], result)
+        self.assertEqual(1, len(errors))
+        self.assertIsInstance(errors[0], RecordConversionError)
+        self.assertEqual(1, errors[0].index)
+
+    def test_should_load_nested_values_from_rows(self):
+        # when
+        result = Parent.from_rows([('p', {'symbol': 'ABC', 'price': 1.0})], ('name', 'child'))
+
+        # then
+        self.assertEqual([Parent('p', Trade('ABC', 1.0))], result)
+
+    def test_should_stream_instances_from_cursor_in_chunks(self):
+        # given
+        connection = sqlite3.connect(':memory:')
+        connection.execute('CREATE TABLE trades (symbol TEXT, price REAL, quantity INTEGER)')
+        connection.executemany('INSERT INTO trades VALUES (?, ?, ?)', [('S{0}'.format(i), i, i) for i in range(5)])
+        cursor = CountingCursor(connection.execute('SELECT * FROM trades ORDER BY quantity'))
+
+        # when
+        result = list(Trade.iter_from_cursor(cursor, fetch_size=2))
+
+        # then
+        self.assertEqual([Trade('S{0}'.format(i), float(i), i) for i in range(5)], result)
+        self.assertEqual([2, 2, 1, 0], cursor.fetches)
+        connection.close()
@@ -0,0 +1,119 @@
+import io
+import json
+from datetime import datetime, date
+from enum import Enum
+from unittest import TestCase
+
+from data_object import DataObject, ImmutableDataObject, dump_ndjson, load_ndjson
+from data_object.exceptions import ConstructorKeywordArgumentNotFound
+
+
+class SomeEnum(Enum):
+    VAL1 = 'val1'
+
+
+class SimpleClass(DataObject):
+    def __init__(self, foo, bar):
+        self.foo = foo
+        self.bar = bar
+
+
+class OtherClass(ImmutableDataObject):
+    def __init__(self, child, when, kind):
+        self.child = child
+        self.when = when
+        self.kind = kind
+
+
+class TestSerialization(TestCase):
+
+    def test_should_get_data_object_as_json_string(self):
+        # given
+        instance = SimpleClass('x', 1)
+
+        # when
+        result = instance.to_json()
+
+        # then
+        self.assertEqual({'foo': 'x', 'bar': 1}, json.loads(result))
+
+    def test_should_encode_nested_object_datetime_and_enum(self):
+        # given
+        instance = OtherClass([SimpleClass('x', date(2000, 10, 5))], datetime(2000, 10, 5, 14, 30), SomeEnum.VAL1)
+
+        # when
+        result = instance.to_json(as_bytes=True)
+
+        # then
+        self.assertIsInstance(result, bytes)
+        self.assertEqual({'child': [{'foo': 'x', 'bar': '2000-10-05'}], 'when': '2000-10-05T14:30:00', 'kind': 'val1'},
+                         json.loads(result))
+
+    def test_should_raise_exception_for_unknown_type(self):
+        # given
+        instance = SimpleClass('x', object())
+
+        # when
+        with self.assertRaisesRegex(TypeError, 'Object of type object is not JSON serializable'):
+            instance.to_json()
+
+    def test_should_dump_and_load_ndjson_in_chunks(self):
+        # given
+        instances = [SimpleClass(str(index), index) for index in range(5)]
+        fp = WriteCountingStream()
+
+        # when
+        count = dump_ndjson(iter(instances), fp, chunk_size=2)
+        fp.seek(0)
+        result = list(load_ndjson(fp, SimpleClass))
+
+        # then
+        self.assertEqual(5, count)
+        self.assertEqual(3, fp.writes)
+        self.assertEqual(instances, result)
+
+    def test_should_dump_ndjson_to_binary_stream(self):
+        # given
+        fp = io.BytesIO()
+
+        # when
+        dump_ndjson([SimpleClass('x', 1), SimpleClass('y', 2)], fp)
+
+        # then
+        self.assertEqual(b'{"foo":"x","bar":1}\n{"foo":"y","bar":2}\n', fp.getvalue())
+
+    def test_should_load_ndjson_with_invalid_records(self):
+        # given
+        fp = io.BytesIO(b'{"foo": "x", "bar": 1}\n\n{"foo": "y"}\n')
+        errors = []
+
+        # when
+        result = list(load_ndjson(fp, SimpleClass, errors=errors))
+
+        # then
+        self.assertEqual([SimpleClass('x', 1)], result)
+        self.assertEqual([2], [error.index for error in errors])
+        self.assertIsInstance(errors[0].cause, ConstructorKeywordArgumentNotFound)
+
+    def test_should_load_ndjson_with_malformed_lines(self):
+        # given
+        fp = io.StringIO('{"foo": "x", "bar": 1}\n{"foo": \n{"foo": "y"}\n{"foo": "z", "bar": 3}\n')
+        errors = []
+
+        # when
+        result = list(load_ndjson(fp, SimpleClass, errors=errors))
+
+        # then
+        self.assertEqual([SimpleClass('x', 1), SimpleClass('z', 3)], result)
+        self.assertEqual([1, 2], [error.index for error in errors])
+        self.assertIsInstance(errors[0].cause, json.JSONDecodeError)
+        self.assertEqual('{"foo": \n', errors[0].record)
+        self.assertIsInstance(errors[1].cause, ConstructorKeywordArgumentNotFound)
+
+
+class WriteCountingStream(io.StringIO):
+    writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
@@ -0,0 +1,211 @@
+import pickle
+import sys
+from unittest import TestCase
+
+from data_object import SlottedDataObject, ImmutableSlottedDataObject, DataObject
+from data_object.exceptions import ImmutableObjectViolation
+
+
+class TestSlottedDataObject(TestCase):
+
+    def test_should_create_slots_from_constructor(self):
+        # given
+        class SimpleClass(SlottedDataObject):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        # when
+        instance = SimpleClass('x', 'y')
+
+        # then
+        self.assertEqual(('foo', 'bar'), SimpleClass.__slots__)
+        self.assertFalse(hasattr(instance, '__dict__'))
+        self.assertEqual('SimpleClass: {"bar": y, "foo": x}', str(instance))
+
+    def test_should_reject_attribute_not_declared_in_constructor(self):
+        # given
+        class SimpleClass(SlottedDataObject):
+            def __init__(self, foo):
+                self.foo = foo
+
+        instance = SimpleClass('x')
+
+        # when
+        with self.assertRaises(AttributeError):
+            instance.bar = 'y'
+
+    def test_should_get_slotted_object_with_properties_and_class_members_as_json(self):
+        # given
+        class SimpleClass(SlottedDataObject):
+            class_member = 'xyz'
+
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+            @property
+            def other(self):
+                return self.foo + self.bar
+
+        # when
+        instance = SimpleClass('x', 'y')
+
+        # then
+        self.assertEqual({'class_member': 'xyz', 'other': 'xy', 'foo': 'x', 'bar': 'y'}, instance.as_json())
+
+    def test_should_add_only_new_slots_in_child_class(self):
+        # given
+        class SimpleClass(SlottedDataObject):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        class ChildClass(SimpleClass):
+            def __init__(self, foo, bar, other):
+                super().__init__(foo, bar)
+                self.other = other
+
+        # when
+        instance = ChildClass('x', 'y', 'z')
+
+        # then
+        self.assertEqual(('other',), ChildClass.__slots__)
+        self.assertEqual('ChildClass: {"bar": y, "foo": x, "other": z}', str(instance))
+
+    def test_should_skip_unset_slots(self):
+        # given
+        class SimpleClass(SlottedDataObject):
+            def __init__(self, foo, bar=None):
+                self.foo = foo
+                if bar is not None:
+                    self.bar = bar
+
+        # when
+        instance = SimpleClass('x')
+
+        # then
+        self.assertEqual({'foo': 'x'}, instance.as_json())
+
+    def test_should_create_slotted_object_from_dict_and_copy(self):
+        # given
+        class SimpleClass(SlottedDataObject):
+            def __init__(self, foo, bar='abc'):
+                self.foo = foo
+                self.bar = bar
+
+        # when
+        instance = SimpleClass.from_dict({'foo': 'x'})
+        result = instance.copy(bar='y')
+
+        # then
+        self.assertEqual('SimpleClass(bar=abc, foo=x)', repr(instance))
+        self.assertEqual('SimpleClass(bar=y, foo=x)', repr(result))
+
+    def test_should_compare_slotted_object_with_dict_backed_object(self):
+        # given
+        class SimpleClass(SlottedDataObject):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        class OtherClass(DataObject):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        # when
+        instance1 = SimpleClass('x', 'y')
+        instance2 = OtherClass('x', 'y')
+
+        # then
+        self.assertEqual(instance1, instance2)
+        self.assertEqual(hash(instance1), hash(instance2))
+
+    def test_should_pickle_slotted_object(self):
+        # given
+        instance = SlottedPickleClass('x', 'y')
+
+        # when
+        result = pickle.loads(pickle.dumps(instance))
+
+        # then
+        self.assertEqual(instance, result)
+
+    def test_should_use_less_memory_than_dict_backed_object(self):
+        # given
+        class SimpleClass(SlottedDataObject):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        class OtherClass(DataObject):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        # when
+        slotted = SimpleClass('x', 'y')
+        dict_backed = OtherClass('x', 'y')
+
+        # then
+        self.assertLess(sys.getsizeof(slotted), sys.getsizeof(dict_backed) + sys.getsizeof(dict_backed.__dict__))
+
+
+class SlottedPickleClass(SlottedDataObject):
+    def __init__(self, foo, bar):
+        self.foo = foo
+        self.bar = bar
+
+
+class TestImmutableSlottedDataObject(TestCase):
+
+    def test_should_raise_exception_on_changing_attribute(self):
+        # given
+        class SimpleClass(ImmutableSlottedDataObject):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        instance = SimpleClass('x', 'y')
+
+        # when
+        with self.assertRaisesRegex(ImmutableObjectViolation, 'Changing attributes not permitted for immutable object'):
+            instance.bar = 'abc'
+
+    def test_should_copy_instance_with_new_value(self):
+        # given
+        class SimpleClass(ImmutableSlottedDataObject):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        instance = SimpleClass('x', 'y')
+
+        # when
+        result = instance.copy(bar='abc')
+
+        # then
+        self.assertEqual(result.foo, 'x')
+        self.assertEqual(result.bar, 'abc')
+        self.assertEqual(len({instance, result, SimpleClass('x', 'y')}), 2)
+
+    def test_should_pickle_frozen_instance(self):
+        # given
+        instance = ImmutableSlottedPickleClass('x', 'y')
+        hash(instance)
+
+        # when
+        result = pickle.loads(pickle.dumps(instance))
+
+        # then
+        self.assertEqual(instance, result)
+        self.assertEqual(hash(instance), hash(result))
+        with self.assertRaises(ImmutableObjectViolation):
+            result.foo = 'z'
+
+
+class ImmutableSlottedPickleClass(ImmutableSlottedDataObject):
+    def __init__(self, foo, bar):
+        self.foo = foo
+        self.bar = bar
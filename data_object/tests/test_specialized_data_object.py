@@ -0,0 +1,228 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from data_object import DataObject, ImmutableDataObject
+from data_object.specialize import specialize, specialize_lazily
+
+
+class TestSpecializedDataObject(TestCase):
+
+    def test_should_get_specialized_data_object_as_string(self):
+        # given
+        class SimpleClass(DataObject, specialized=True):
+            class_member = 'xyz'
+
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        # when
+        instance = SimpleClass('x', 'y')
+
+        # then
+        self.assertEqual('SimpleClass: {"bar": y, "class_member": xyz, "foo": x}', str(instance))
+        self.assertEqual('SimpleClass(bar=y, class_member=xyz, foo=x)', repr(instance))
+        self.assertTrue(SimpleClass.__str__.__specialized__)
+
+    def test_should_return_equal_true_for_specialized_object_with_same_fields(self):
+        # given
+        class SimpleClass(DataObject, specialized=True):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        # when
+        instance1 = SimpleClass('x', 'y')
+        instance2 = SimpleClass(bar='y', foo='x')
+
+        # then
+        self.assertEqual(instance1, instance2)
+        self.assertEqual(hash(instance1), hash(instance2))
+        self.assertNotEqual(instance1, SimpleClass('x', 'z'))
+
+    def test_should_compare_specialized_object_with_other_class(self):
+        # given
+        class SimpleClass(DataObject, specialized=True):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        class OtherClass(DataObject):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        # when
+        instance1 = SimpleClass('x', 'y')
+        instance2 = OtherClass('x', 'y')
+
+        # then
+        self.assertNotEqual(instance1, instance2)
+        self.assertNotEqual(instance2, instance1)
+        self.assertNotEqual(instance1, object())
+
+    def test_should_fall_back_to_generic_methods_for_attributes_set_outside_constructor(self):
+        # given
+        class SimpleClass(DataObject, specialized=True):
+            def __init__(self, foo):
+                self.foo = foo
+                self.bar = 'y'
+
+        instance1 = SimpleClass('x')
+        instance2 = SimpleClass('x')
+
+        # when
+        instance2.bar = 'z'
+
+        # then
+        self.assertEqual("SimpleClass(bar=y, foo=x)", repr(instance1))
+        self.assertEqual('SimpleClass: {"bar": y, "foo": x}', str(instance1))
+        self.assertNotEqual(instance1, instance2)
+        self.assertEqual(instance1, SimpleClass('x'))
+        self.assertEqual(hash(instance1), hash(SimpleClass('x')))
+
+    def test_should_specialize_class_once(self):
+        # given
+        with patch('data_object.data_object.specialize', wraps=specialize) as specialize_mock:
+            # when
+            class SimpleClass(DataObject, specialized=True):
+                def __init__(self, foo):
+                    self.foo = foo
+
+        # then
+        specialize_mock.assert_called_once_with(SimpleClass, DataObject)
+
+    def test_should_not_regenerate_methods_when_class_value_changes(self):
+        # given
+        class SimpleClass(DataObject, specialized=True):
+            counter = 0
+
+            def __init__(self, foo):
+                self.foo = foo
+
+        # when
+        with patch('data_object.data_object.specialize_lazily', wraps=specialize_lazily) as refresh_mock:
+            SimpleClass.counter += 1
+            SimpleClass._private = 1
+
+        # then
+        refresh_mock.assert_not_called()
+        self.assertEqual('SimpleClass(counter=1, foo=x)', repr(SimpleClass('x')))
+        self.assertEqual({'counter': 1, 'foo': 'x'}, SimpleClass('x').as_json())
+
+    def test_should_fall_back_to_generic_methods_when_field_missing(self):
+        # given
+        class SimpleClass(DataObject, specialized=True):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.other = bar
+
+        # when
+        instance1 = SimpleClass('x', 'y')
+        instance2 = SimpleClass('x', 'y')
+
+        # then
+        self.assertEqual('SimpleClass: {"foo": x, "other": y}', str(instance1))
+        self.assertEqual(instance1, instance2)
+        self.assertEqual(hash(instance1), hash(instance2))
+
+    def test_should_use_declared_fields_in_specialized_object(self):
+        # given
+        class SimpleClass(DataObject, specialized=True):
+            __fields__ = ('foo', 'other')
+
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.other = bar
+
+        # when
+        instance = SimpleClass('x', 'y')
+
+        # then
+        self.assertEqual('SimpleClass(foo=x, other=y)', repr(instance))
+
+    def test_should_hash_specialized_object_with_unhashable_field(self):
+        # given
+        class SimpleClass(DataObject, specialized=True):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        # when
+        result = {SimpleClass('x', [1, 2]), SimpleClass('x', [1, 2])}
+
+        # then
+        self.assertEqual(len(result), 1)
+
+    def test_should_keep_user_defined_method_in_specialized_object(self):
+        # given
+        class SimpleClass(DataObject, specialized=True):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+            def __repr__(self):
+                return 'custom'
+
+        class ChildClass(SimpleClass):
+            pass
+
+        # when
+        instance = ChildClass('x', 'y')
+
+        # then
+        self.assertEqual('custom', repr(instance))
+        self.assertEqual('ChildClass: {"bar": y, "foo": x}', str(instance))
+
+    def test_should_regenerate_methods_for_child_class(self):
+        # given
+        class SimpleClass(DataObject, specialized=True):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        class ChildClass(SimpleClass):
+            def __init__(self, foo, bar, other):
+                super().__init__(foo, bar)
+                self.other = other
+
+        # when
+        instance1 = ChildClass('x', 'y', 'z')
+        instance2 = ChildClass('x', 'y', 'a')
+
+        # then
+        self.assertEqual('ChildClass(bar=y, foo=x, other=z)', repr(instance1))
+        self.assertNotEqual(instance1, instance2)
+
+    def test_should_regenerate_methods_when_constructor_replaced(self):
+        # given
+        class SimpleClass(DataObject, specialized=True):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        def new_init(self, foo):
+            self.foo = foo
+
+        # when
+        SimpleClass.__init__ = new_init
+        instance = SimpleClass('x')
+
+        # then
+        self.assertEqual('SimpleClass(foo=x)', repr(instance))
+
+    def test_should_create_specialized_immutable_object(self):
+        # given
+        class SimpleClass(ImmutableDataObject, specialized=True):
+            def __init__(self, foo, bar):
+                self.foo = foo
+                self.bar = bar
+
+        # when
+        instance1 = SimpleClass('x', 'y')
+        instance2 = SimpleClass('x', 'y')
+
+        # then
+        self.assertEqual(instance1, instance2)
+        self.assertEqual(len({instance1, instance2}), 1)
+        self.assertIs(SimpleClass.__hash__, ImmutableDataObject.__hash__)
@@ -0,0 +1,112 @@
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from data_object import DataObjectStore, ImmutableDataObject
+from data_object.exceptions import StoreError
+
+
+class Record(ImmutableDataObject):
+    def __init__(self, number: int, label: str):
+        self.number = number
+        self.label = label
+
+
+class OtherRecord(ImmutableDataObject):
+    def __init__(self, number: int, label: bytes):
+        self.number = number
+        self.label = label
+
+
+class TestDataObjectStore(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'records.dos')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_should_append_and_get_records_by_number(self):
+        # given
+        with DataObjectStore(self.path, Record) as store:
+            # when
+            first = store.append(Record(1, 'a'))
+            store.extend(Record(number, str(number)) for number in range(2, 10))
+
+            # then
+            self.assertEqual(0, first)
+            self.assertEqual(9, len(store))
+            self.assertEqual(Record(1, 'a'), store[0])
+            self.assertEqual(Record(9, '9'), store[-1])
+            self.assertEqual('5', store.view(4).label)
+            with self.assertRaises(IndexError):
+                store[9]
+
+    def test_should_append_after_reading(self):
+        # given
+        with DataObjectStore(self.path, Record) as store:
+            store.append(Record(1, 'a'))
+            store[0]
+
+            # when
+            store.append(Record(2, 'b'))
+
+            # then
+            self.assertEqual(Record(2, 'b'), store[1])
+            self.assertEqual([Record(1, 'a'), Record(2, 'b')], list(store))
+
+    def test_should_reopen_store(self):
+        # given
+        with DataObjectStore(self.path, Record) as store:
+            store.extend(Record(number, str(number)) for number in range(100))
+
+        # when
+        with DataObjectStore(self.path, Record) as store:
+            store.append(Record(100, '100'))
+
+            # then
+            self.assertEqual(101, len(store))
+            self.assertEqual(Record(42, '42'), store[42])
+            self.assertEqual(list(range(101)), [record.number for record in store])
+
+    def test_should_iterate_empty_store(self):
+        # when
+        with DataObjectStore(self.path, Record) as store:
+            # then
+            self.assertEqual([], list(store))
+            with self.assertRaises(IndexError):
+                store[0]
+
+    def test_should_raise_exception_when_schema_changed(self):
+        # given
+        with DataObjectStore(self.path, Record) as store:
+            store.append(Record(1, 'a'))
+
+        # when
+        with self.assertRaisesRegex(StoreError, 'was written with different schema of OtherRecord'):
+            DataObjectStore(self.path, OtherRecord)
+
+    def test_should_raise_exception_for_not_store_file(self):
+        # given
+        with open(self.path, 'wb') as fp:
+            fp.write(b'something else')
+
+        # when
+        with self.assertRaisesRegex(StoreError, 'is not a data object store'):
+            DataObjectStore(self.path, Record)
+
+    def test_should_open_store_with_path_object(self):
+        # given
+        path = Path(self.path)
+
+        # when
+        with DataObjectStore(path, Record) as store:
+            store.append(Record(1, 'a'))
+
+        # then
+        self.assertTrue(Path(self.path + '.idx').exists())
+        with DataObjectStore(path, Record) as store:
+            self.assertEqual([Record(1, 'a')], list(store))
@@ -0,0 +1,93 @@
+from unittest import TestCase
+
+from data_object import DataObject, ImmutableDataObject, SlottedDataObject
+from data_object.exceptions import ChangeTrackingError
+
+
+class Account(DataObject, track_changes=True):
+    def __init__(self, owner, balance=0):
+        self.owner = owner
+        self.balance = balance
+
+
+class SlottedAccount(SlottedDataObject, track_changes=True):
+    def __init__(self, owner, balance=0):
+        self.owner = owner
+        self.balance = balance
+
+
+class FrozenAccount(ImmutableDataObject):
+    def __init__(self, owner, balance=0):
+        self.owner = owner
+        self.balance = balance
+
+
+class TestChangeTracking(TestCase):
+
+    def test_should_track_changes_since_checkpoint(self):
+        for cls in (Account, SlottedAccount):
+            # given
+            account = cls('John')
+            account.checkpoint()
+
+            # when
+            account.balance = 10
+
+            # then
+            self.assertEqual(frozenset({'balance'}), account.changed_fields())
+            self.assertEqual({'balance': 10}, account.to_patch())
+
+    def test_should_treat_new_instance_as_changed(self):
+        # when
+        account = Account('John')
+
+        # then
+        self.assertEqual(frozenset({'owner', 'balance'}), account.changed_fields())
+
+    def test_should_not_include_tracking_state_in_comparison_and_serialization(self):
+        # given
+        account = Account('John')
+        other = Account('John')
+        other.checkpoint()
+
+        # then
+        self.assertEqual(account, other)
+        self.assertEqual(hash(account), hash(other))
+        self.assertEqual({'owner': 'John', 'balance': 0}, other.as_json())
+
+    def test_should_raise_error_when_tracking_disabled(self):
+        # given
+        account = FrozenAccount('John')
+
+        # then
+        with self.assertRaises(ChangeTrackingError):
+            account.changed_fields()
+        with self.assertRaises(ChangeTrackingError):
+            account.checkpoint()
+
+    def test_should_diff_and_apply_patch(self):
+        # given
+        account = Account('John', 10)
+        other = Account('John', 20)
+
+        # when
+        patch = account.diff(other)
+        account.checkpoint()
+        result = account.apply_patch(patch)
+
+        # then
+        self.assertEqual({'balance': 20}, patch)
+        self.assertIs(account, result)
+        self.assertEqual(other, account)
+        self.assertEqual(frozenset({'balance'}), account.changed_fields())
+
+    def test_should_apply_patch_to_copy_of_immutable(self):
+        # given
+        account = FrozenAccount('John', 10)
+
+        # when
+        result = account.apply_patch(account.diff(FrozenAccount('John', 20)))
+
+        # then
+        self.assertEqual(FrozenAccount('John', 10), account)
+        self.assertEqual(FrozenAccount('John', 20), result)
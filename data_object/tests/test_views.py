@@ -0,0 +1,95 @@
+import mmap
+import tempfile
+from typing import Optional
+from unittest import TestCase
+
+from data_object import DataObject, ImmutableDataObject
+from data_object.exceptions import ImmutableObjectViolation
+
+
+class Leaf(ImmutableDataObject):
+    def __init__(self, name: str, weight: float):
+        self.name = name
+        self.weight = weight
+
+
+class Record(DataObject):
+    def __init__(self, number: int, label: Optional[str], payload: bytes, flag: bool, leaf: Optional[Leaf] = None):
+        self.number = number
+        self.label = label
+        self.payload = payload
+        self.flag = flag
+        self.leaf = leaf
+
+
+class TestRecordView(TestCase):
+
+    def test_should_decode_fields_lazily(self):
+        # given
+        instance = Record(7, 'abc', b'xyz', True, Leaf('a', 1.5))
+
+        # when
+        view = Record.view(instance.to_bytes())
+
+        # then
+        self.assertEqual(7, view.number)
+        self.assertEqual('abc', view.label)
+        self.assertEqual(b'xyz', view.payload)
+        self.assertIs(True, view.flag)
+        self.assertEqual('a', view.leaf.name)
+        self.assertEqual(1.5, view.leaf.weight)
+        self.assertIsNone(view._RecordView__instance)
+
+    def test_should_decode_none_values(self):
+        # given
+        instance = Record(None, None, b'', False)
+
+        # when
+        view = Record.view(instance.to_bytes())
+
+        # then
+        self.assertIsNone(view.number)
+        self.assertIsNone(view.label)
+        self.assertIsNone(view.leaf)
+
+    def test_should_compare_and_hash_view_like_data_object(self):
+        # given
+        instance = Record(7, 'abc', b'xyz', True, Leaf('a', 1.5))
+
+        # when
+        view = Record.view(instance.to_bytes())
+
+        # then
+        self.assertEqual(instance.as_json(), view.as_json())
+        self.assertEqual(instance, view)
+        self.assertEqual(view, instance)
+        self.assertEqual(hash(instance), hash(view))
+        self.assertEqual(str(instance), str(view))
+        self.assertEqual(1, len({view, Record.view(instance.to_bytes()), instance}))
+
+    def test_should_raise_exception_on_changing_attribute(self):
+        # given
+        view = Record.view(Record(7, 'abc', b'xyz', True).to_bytes())
+
+        # when
+        with self.assertRaises(ImmutableObjectViolation):
+            view.number = 5
+
+    def test_should_iterate_views_over_memory_mapped_file(self):
+        # given
+        instances = [Record(number, str(number), b'', number % 2 == 0) for number in range(100)]
+
+        with tempfile.TemporaryFile() as fp:
+            fp.write(Record.to_bytes_many(instances))
+            fp.flush()
+            mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+            # when
+            views = list(Record.iter_views(mapped))
+            labels = [view.label for view in views]
+
+            # then
+            self.assertEqual([str(number) for number in range(100)], labels)
+            self.assertEqual(instances[42], views[42])
+            del views
+            mapped.close()
@@ -0,0 +1,103 @@
+from struct import Struct
+
+from data_object.binary import FIXED_CODES, LENGTH_PREFIX, binary_schema_of
+from data_object.exceptions import ImmutableObjectViolation
+
+
+class RecordView:
+    __slots__ = ('_buffer', '_offset', '__instance')
+    data_class = None
+
+    def __init__(self, buffer, offset=0) -> None:
+        object.__setattr__(self, '_buffer', buffer if isinstance(buffer, memoryview) else memoryview(buffer))
+        object.__setattr__(self, '_offset', offset)
+        object.__setattr__(self, '_RecordView__instance', None)
+
+    def materialize(self):
+        instance = self.__instance
+        if instance is None:
+            instance = binary_schema_of(self.data_class).unpack(self._buffer, self._offset)
+            object.__setattr__(self, '_RecordView__instance', instance)
+        return instance
+
+    def as_json(self, *args, **kwargs):
+        return self.materialize().as_json(*args, **kwargs)
+
+    def __eq__(self, o: object) -> bool:
+        return self.materialize() == (o.materialize() if isinstance(o, RecordView) else o)
+
+    def __ne__(self, o: object) -> bool:
+        return not self.__eq__(o)
+
+    def __hash__(self) -> int:
+        return hash(self.materialize())
+
+    def __str__(self) -> str:
+        return str(self.materialize())
+
+    def __repr__(self) -> str:
+        return '{0}({1!r})'.format(type(self).__name__, self.materialize())
+
+    def __setattr__(self, name, value):
+        raise ImmutableObjectViolation('Changing attributes not permitted for immutable object')
+
+
+def _fixed_getter(field_struct, offset, byte_index, mask):
+    def get(self):
+        buffer, base = self._buffer, self._offset
+        if buffer[base + byte_index] & mask:
+            return None
+        return field_struct.unpack_from(buffer, base + offset)[0]
+    return get
+
+
+def _variable_getter(index, kind, lengths_struct, lengths_offset, data_offset, byte_index, mask):
+    def get(self):
+        buffer, base = self._buffer, self._offset
+        if buffer[base + byte_index] & mask:
+            return None
+        lengths = lengths_struct.unpack_from(buffer, base + lengths_offset)
+        start = base + data_offset + sum(lengths[:index])
+        chunk = buffer[start:start + lengths[index]]
+        if kind is str:
+            return str(chunk, 'utf-8')
+        if kind is bytes:
+            return bytes(chunk)
+        return view_class_of(kind)(chunk)
+    return get
+
+
+def _make_view_class(cls):
+    binary = binary_schema_of(cls)
+    namespace = {'__slots__': (), 'data_class': cls}
+    offset = binary.bitmap_size
+    bit = 0
+    for field, kind in binary.fixed:
+        field_struct = Struct('<' + FIXED_CODES[kind])
+        namespace[field] = property(_fixed_getter(field_struct, offset, bit // 8, 1 << bit % 8))
+        offset += field_struct.size
+        bit += 1
+    lengths_struct = Struct('<' + 'I' * len(binary.variable))
+    for index, (field, kind) in enumerate(binary.variable):
+        namespace[field] = property(_variable_getter(index, kind, lengths_struct, offset, binary.header.size,
+                                                     bit // 8, 1 << bit % 8))
+        bit += 1
+    return type(cls.__name__ + 'View', (RecordView,), namespace)
+
+
+def view_class_of(cls):
+    binary = binary_schema_of(cls)
+    if binary.view_class is None:
+        binary.view_class = _make_view_class(cls)
+    return binary.view_class
+
+
+def iter_views(cls, buffer):
+    view_class = view_class_of(cls)
+    view = buffer if isinstance(buffer, memoryview) else memoryview(buffer)
+    position = 0
+    while position < len(view):
+        length, = LENGTH_PREFIX.unpack_from(view, position)
+        position += LENGTH_PREFIX.size
+        yield view_class(view, position)
+        position += length
@@ -30,9 +30,10 @@ setup(
     packages=find_packages(),
     extras_require={
         'test': ['coverage', 'nose', 'flake8'],
+        'numpy': ['numpy'],
     },
     tests_require=['nose', 'coverage'],
     setup_requires=['setuptools_scm', 'wheel', 'twine'],
-    python_requires='>=3',
+    python_requires='>=3.8',
     test_suite='nose.collector',
 )